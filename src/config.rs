@@ -1,5 +1,6 @@
 use std::io::Write;
 use std::path::Path;
+use std::time::SystemTime;
 
 use serde::Deserialize;
 
@@ -7,7 +8,10 @@ use crate::models::{stop_ids_to_station_stops, StationStop};
 use crate::mta::stations;
 
 /// Atomically write config: write to .tmp, sync, backup existing to .bak, rename .tmp to primary.
-pub fn atomic_write_config(path: &Path, json: &str) -> Result<(), ConfigError> {
+///
+/// Returns the written file's mtime, read from the synced temp file before
+/// the rename (which preserves it), so a later edit always has a newer mtime.
+pub fn atomic_write_config(path: &Path, json: &str) -> Result<Option<SystemTime>, ConfigError> {
     let tmp_path = path.with_extension("json.tmp");
     let bak_path = path.with_extension("json.bak");
 
@@ -18,17 +22,21 @@ pub fn atomic_write_config(path: &Path, json: &str) -> Result<(), ConfigError> {
         .map_err(|e| ConfigError::Io(format!("write tmp: {}", e)))?;
     file.sync_all()
         .map_err(|e| ConfigError::Io(format!("sync tmp: {}", e)))?;
+    let written_mtime = config_mtime(&tmp_path);
 
-    // Backup existing config (ignore error if no existing file)
-    if path.exists() {
-        let _ = std::fs::copy(path, &bak_path);
-    }
+    // Backup existing config (copy fails harmlessly if there is no existing file)
+    let _ = std::fs::copy(path, &bak_path);
 
     // Atomic rename (same filesystem guarantees atomicity)
     std::fs::rename(&tmp_path, path)
         .map_err(|e| ConfigError::Io(format!("rename tmp->config: {}", e)))?;
 
-    Ok(())
+    Ok(written_mtime)
+}
+
+/// Modification time of the config file, or `None` if it can't be read.
+pub fn config_mtime(path: &Path) -> Option<SystemTime> {
+    std::fs::metadata(path).and_then(|m| m.modified()).ok()
 }
 
 /// Top-level configuration file structure.
@@ -121,15 +129,19 @@ impl Config {
             }
         }
 
-        // Fallback to backup
-        if bak_path.exists() {
-            let contents = std::fs::read_to_string(&bak_path)
-                .map_err(|e| ConfigError::Io(format!("read backup: {}", e)))?;
-            let cfg = Self::from_json(&contents)?;
-            tracing::warn!("Loaded config from backup: {}", bak_path.display());
-            // Restore backup as primary
-            let _ = std::fs::copy(&bak_path, path);
-            return Ok(cfg);
+        // Fallback to backup (read directly; a missing backup is not an error here)
+        match std::fs::read_to_string(&bak_path) {
+            Ok(contents) => {
+                let cfg = Self::from_json(&contents)?;
+                tracing::warn!("Loaded config from backup: {}", bak_path.display());
+                // Restore backup as primary
+                let _ = std::fs::copy(&bak_path, path);
+                return Ok(cfg);
+            }
+            Err(e) if e.kind() != std::io::ErrorKind::NotFound => {
+                return Err(ConfigError::Io(format!("read backup: {}", e)));
+            }
+            Err(_) => {}
         }
 
         Err(ConfigError::Io(format!(
@@ -142,29 +154,40 @@ impl Config {
     pub fn from_json(json: &str) -> Result<Self, ConfigError> {
         let raw: RawConfig =
             serde_json::from_str(json).map_err(|e| ConfigError::Parse(e.to_string()))?;
+        Self::from_raw(raw)
+    }
 
+    /// Build config from an already-parsed JSON value (e.g. a web request body).
+    pub fn from_value(value: &serde_json::Value) -> Result<Self, ConfigError> {
+        let raw = RawConfig::deserialize(value).map_err(|e| ConfigError::Parse(e.to_string()))?;
+        Self::from_raw(raw)
+    }
+
+    /// Resolve and validate a deserialized config file.
+    fn from_raw(raw: RawConfig) -> Result<Self, ConfigError> {
         let station = raw.station;
 
         // Resolve station stops and routes based on format
         let (stops, routes) = if let Some(ref station_name) = station.station_name {
             if !station_name.is_empty() {
-                Self::resolve_station_name(station_name, &station.routes)?
+                Self::resolve_station_name(station_name, station.routes)?
             } else {
                 return Err(ConfigError::Validation(
                     "station_name is empty".to_string(),
                 ));
             }
-        } else if let Some(ref station_pairs) = station.stations {
+        } else if let Some(station_pairs) = station.stations {
+            // Move the parsed strings into place rather than cloning them
             let stops: Vec<StationStop> = station_pairs
-                .iter()
-                .map(|p| (p.uptown.clone(), p.downtown.clone()))
+                .into_iter()
+                .map(|p| (p.uptown, p.downtown))
                 .collect();
             let routes = station.routes.unwrap_or_default();
             (stops, routes)
-        } else if let (Some(ref up), Some(ref down)) =
-            (&station.uptown_stop_id, &station.downtown_stop_id)
+        } else if let (Some(up), Some(down)) =
+            (station.uptown_stop_id, station.downtown_stop_id)
         {
-            let stops = vec![(up.clone(), down.clone())];
+            let stops = vec![(up, down)];
             let routes = station.routes.unwrap_or_default();
             (stops, routes)
         } else {
@@ -189,24 +212,19 @@ impl Config {
     /// Resolve a station name to stop IDs and routes via the station database.
     fn resolve_station_name(
         station_name: &str,
-        explicit_routes: &Option<Vec<String>>,
+        explicit_routes: Option<Vec<String>>,
     ) -> Result<(Vec<StationStop>, Vec<String>), ConfigError> {
-        let stop_ids = stations::get_stop_ids_for_station(station_name);
-        if stop_ids.is_empty() {
-            return Err(ConfigError::StationNotFound(station_name.to_string()));
-        }
+        // Resolve once; stop IDs and routes both come from the same record
+        let station = stations::find_station(station_name)
+            .filter(|s| !s.stop_ids.is_empty())
+            .ok_or_else(|| ConfigError::StationNotFound(station_name.to_string()))?;
 
-        let stops = stop_ids_to_station_stops(&stop_ids);
+        let stops = stop_ids_to_station_stops(&station.stop_ids);
 
         // Use explicit routes if provided, otherwise auto-detect from station DB
-        let routes = if let Some(r) = explicit_routes {
-            if !r.is_empty() {
-                r.clone()
-            } else {
-                stations::get_routes_for_station(station_name)
-            }
-        } else {
-            stations::get_routes_for_station(station_name)
+        let routes = match explicit_routes {
+            Some(r) if !r.is_empty() => r,
+            _ => station.routes.clone(),
         };
 
         Ok((stops, routes))
@@ -287,6 +305,23 @@ mod tests {
         assert_eq!(config.display.max_trains, 7);
     }
 
+    #[test]
+    fn test_from_value_matches_from_json() {
+        let json = r#"{
+            "station": {"stations": [{"uptown": "127N", "downtown": "127S"}], "routes": ["1"]},
+            "display": {"brightness": 0.5, "max_trains": 4, "show_alerts": false}
+        }"#;
+        let value: serde_json::Value = serde_json::from_str(json).unwrap();
+        let from_value = Config::from_value(&value).unwrap();
+        let from_json = Config::from_json(json).unwrap();
+        assert_eq!(from_value.station_stops, from_json.station_stops);
+        assert_eq!(from_value.routes, from_json.routes);
+        assert_eq!(from_value.display.max_trains, from_json.display.max_trains);
+
+        let err = Config::from_value(&serde_json::json!({"display": {}})).unwrap_err();
+        assert!(matches!(err, ConfigError::Parse(_)));
+    }
+
     #[test]
     fn test_load_stations_array_format() {
         let json = r#"{
@@ -461,7 +496,9 @@ mod tests {
         .unwrap();
         // Atomic write new config
         let new_json = r#"{"station":{"station_name":"14 St-Union Sq","routes":["4","5","6"]},"display":{"brightness":0.8,"max_trains":6,"show_alerts":true}}"#;
-        atomic_write_config(&path, new_json).unwrap();
+        let written_mtime = atomic_write_config(&path, new_json).unwrap();
+        assert!(written_mtime.is_some());
+        assert_eq!(written_mtime, config_mtime(&path));
         // Verify backup exists with old content
         let bak = path.with_extension("json.bak");
         assert!(bak.exists());
@@ -500,6 +537,15 @@ mod tests {
         assert!(Config::load(&path).is_err());
     }
 
+    #[test]
+    fn test_load_fails_cleanly_without_backup() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("config.json");
+        std::fs::write(&path, "CORRUPT").unwrap();
+        let err = Config::load(&path).unwrap_err();
+        assert!(err.to_string().contains("or backup"));
+    }
+
     #[test]
     fn test_auto_detect_routes() {
         // No explicit routes — should auto-detect from station DB
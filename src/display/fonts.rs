@@ -3,6 +3,8 @@ use std::sync::OnceLock;
 
 use serde::Deserialize;
 
+use super::colors::Rgb;
+
 /// Font height in pixels (from the JSON font definition).
 pub const FONT_HEIGHT: usize = 16;
 
@@ -22,32 +24,79 @@ struct IconMeta {
     color: String,
 }
 
-/// A rendered route icon bitmap.
+/// Character bitmap: one packed `u64` per row, LSB-first (bit x = column x).
+pub type CharBitmap = Vec<u64>;
+
+/// A route icon bitmap.
+///
+/// Icons are single-color with 1-bit alpha, so they are stored as packed
+/// rows (same layout as `CharBitmap`) plus one color.
 #[derive(Debug, Clone)]
 pub struct RouteIcon {
-    /// Pixel data: row-major, each pixel is (r, g, b, a).
-    pub pixels: Vec<Vec<(u8, u8, u8, u8)>>,
+    /// Opaque pixels, one packed row per line, LSB-first (bit x = column x).
+    pub rows: CharBitmap,
+    pub color: Rgb,
     pub width: usize,
     pub baseline_offset: i32,
 }
 
-/// Character bitmap: one `Vec<bool>` per row, LSB-first decoded.
-pub type CharBitmap = Vec<Vec<bool>>;
-
-/// The MTA bitmap font with pre-decoded character glyphs and route icons.
+/// The MTA bitmap font with pre-computed character glyphs and route icons.
 ///
-/// All bitmaps are decoded at load time — zero per-frame allocations.
+/// All bitmaps are built at load time — zero per-frame allocations.
 pub struct MtaFont {
-    /// Pre-decoded character bitmaps (regular).
-    chars_decoded: HashMap<char, CharBitmap>,
-    /// Pre-decoded character bitmaps (italic).
-    italic_decoded: HashMap<char, CharBitmap>,
-    /// Pre-computed character widths.
-    char_widths: HashMap<(char, bool), usize>,
-    /// Pre-computed left padding (empty columns before first lit pixel).
-    char_left_padding: HashMap<(char, bool), usize>,
-    /// Route icon bitmaps.
-    route_icons: HashMap<String, RouteIcon>,
+    /// Character bitmaps (regular).
+    chars: HashMap<char, CharBitmap>,
+    /// Character bitmaps (italic).
+    italic: HashMap<char, CharBitmap>,
+    /// Pre-computed width and left padding for both styles.
+    metrics: GlyphMetricsTable,
+    /// Local (circle) route icons, keyed by route ID.
+    circle_icons: HashMap<String, RouteIcon>,
+    /// Express (diamond) route icons, keyed by route ID.
+    diamond_icons: HashMap<String, RouteIcon>,
+}
+
+/// Per-glyph layout metrics, pre-computed at load time.
+#[derive(Debug, Clone, Copy)]
+struct GlyphMetrics {
+    width: usize,
+    /// Empty columns before the first lit pixel.
+    left_padding: usize,
+}
+
+/// Glyph metrics keyed by (char, italic).
+///
+/// Text measurement queries these for every character of every string each
+/// frame, so ASCII (the whole embedded font) lives in a flat table indexed by
+/// code point instead of behind a hash lookup.
+struct GlyphMetricsTable {
+    ascii: [[Option<GlyphMetrics>; 2]; 128],
+    other: HashMap<(char, bool), GlyphMetrics>,
+}
+
+impl GlyphMetricsTable {
+    fn new() -> Self {
+        GlyphMetricsTable {
+            ascii: [[None; 2]; 128],
+            other: HashMap::new(),
+        }
+    }
+
+    fn insert(&mut self, ch: char, italic: bool, metrics: GlyphMetrics) {
+        if ch.is_ascii() {
+            self.ascii[ch as usize][italic as usize] = Some(metrics);
+        } else {
+            self.other.insert((ch, italic), metrics);
+        }
+    }
+
+    fn get(&self, ch: char, italic: bool) -> Option<GlyphMetrics> {
+        if ch.is_ascii() {
+            self.ascii[ch as usize][italic as usize]
+        } else {
+            self.other.get(&(ch, italic)).copied()
+        }
+    }
 }
 
 static MTA_FONT: OnceLock<MtaFont> = OnceLock::new();
@@ -59,64 +108,43 @@ pub fn get_font() -> &'static MtaFont {
 
 impl MtaFont {
     fn load() -> Self {
-        // Parse font JSON as generic map
-        let font_data: HashMap<String, serde_json::Value> =
+        // Parse font JSON as generic map. Keys borrow from the embedded
+        // string (it contains no escapes), so no per-key allocation.
+        let font_data: HashMap<&str, serde_json::Value> =
             serde_json::from_str(FONT_JSON).expect("embedded font JSON is valid");
 
         // Extract character glyphs (numeric keys = ASCII codes) as raw u64 rows
-        let mut raw_chars: HashMap<char, Vec<u64>> = HashMap::new();
-        for (key, value) in &font_data {
-            if let Ok(code) = key.parse::<u32>() {
-                if let Some(ch) = char::from_u32(code) {
-                    if let Some(rows) = value.as_array() {
-                        let row_vals: Vec<u64> = rows
-                            .iter()
-                            .filter_map(|v| v.as_u64())
-                            .collect();
-                        raw_chars.insert(ch, row_vals);
-                    }
-                }
-            }
-        }
-
-        // Generate italic raw data
-        let raw_italic = Self::generate_italic_raw(&raw_chars);
-
-        // Pre-decode all bitmaps
-        let chars_decoded: HashMap<char, CharBitmap> = raw_chars
+        let raw_chars: HashMap<char, Vec<u64>> = font_data
             .iter()
-            .map(|(&ch, rows)| (ch, Self::decode_bitmap(rows)))
+            .filter_map(|(key, value)| {
+                let ch = char::from_u32(key.parse::<u32>().ok()?)?;
+                let rows = value.as_array()?;
+                Some((ch, rows.iter().filter_map(|v| v.as_u64()).collect()))
+            })
             .collect();
 
-        let italic_decoded: HashMap<char, CharBitmap> = raw_italic
-            .iter()
-            .map(|(&ch, rows)| (ch, Self::decode_bitmap(rows)))
-            .collect();
+        // Generate italic raw data
+        let raw_italic = Self::generate_italic_raw(&raw_chars);
 
         // Pre-compute widths and left-padding for all chars in both styles
-        let mut char_widths = HashMap::new();
-        let mut char_left_padding = HashMap::new();
+        let mut metrics = GlyphMetricsTable::new();
 
-        for (&ch, bitmap) in &chars_decoded {
-            let w = if ch == ' ' { 4 } else { Self::compute_width(bitmap) };
-            char_widths.insert((ch, false), w);
-            char_left_padding.insert((ch, false), Self::compute_left_padding(bitmap));
+        for (&ch, rows) in &raw_chars {
+            metrics.insert(ch, false, Self::compute_metrics(ch, rows));
         }
-        for (&ch, bitmap) in &italic_decoded {
-            let w = if ch == ' ' { 4 } else { Self::compute_width(bitmap) };
-            char_widths.insert((ch, true), w);
-            char_left_padding.insert((ch, true), Self::compute_left_padding(bitmap));
+        for (&ch, rows) in &raw_italic {
+            metrics.insert(ch, true, Self::compute_metrics(ch, rows));
         }
 
         // Load route icons
-        let route_icons = Self::load_route_icons(&font_data);
+        let (circle_icons, diamond_icons) = Self::load_route_icons(&font_data);
 
         MtaFont {
-            chars_decoded,
-            italic_decoded,
-            char_widths,
-            char_left_padding,
-            route_icons,
+            chars: raw_chars,
+            italic: raw_italic,
+            metrics,
+            circle_icons,
+            diamond_icons,
         }
     }
 
@@ -146,117 +174,113 @@ impl MtaFont {
         italic
     }
 
-    /// Decode raw u64 row data into a CharBitmap (LSB-first).
-    fn decode_bitmap(rows: &[u64]) -> CharBitmap {
-        let mut bitmap = Vec::with_capacity(rows.len());
-        for &row_val in rows {
-            let max_bits = if row_val > 0 {
-                64 - row_val.leading_zeros() as usize
-            } else {
-                1
-            };
-            let mut bits = Vec::with_capacity(max_bits);
-            for i in 0..max_bits {
-                bits.push(row_val & (1 << i) != 0);
-            }
-            bitmap.push(bits);
-        }
-        bitmap
-    }
-
-    /// Compute pixel width from a pre-decoded bitmap.
-    fn compute_width(bitmap: &CharBitmap) -> usize {
-        bitmap.iter().map(|row| row.len()).max().unwrap_or(4)
-    }
-
-    /// Compute left padding from a pre-decoded bitmap.
-    fn compute_left_padding(bitmap: &CharBitmap) -> usize {
-        let mut leftmost = usize::MAX;
-        for row in bitmap {
-            for (col, &pixel) in row.iter().enumerate() {
-                if pixel {
-                    leftmost = leftmost.min(col);
-                    break;
-                }
-            }
-        }
-        if leftmost == usize::MAX { 0 } else { leftmost }
+    /// Compute width and left padding from raw LSB-first row data.
+    ///
+    /// Both come from one OR-reduction over the rows: the widest row's bit
+    /// length is the bit length of the OR, and the leftmost lit column is its
+    /// lowest set bit. A blank row still decodes to one column, so non-empty
+    /// glyphs are at least 1px wide. Space is fixed at 4px.
+    fn compute_metrics(ch: char, rows: &[u64]) -> GlyphMetrics {
+        let combined = rows.iter().fold(0, |acc, &row| acc | row);
+        let width = if ch == ' ' || rows.is_empty() {
+            4
+        } else {
+            (64 - combined.leading_zeros() as usize).max(1)
+        };
+        let left_padding = if combined == 0 { 0 } else { combined.trailing_zeros() as usize };
+        GlyphMetrics { width, left_padding }
     }
 
     /// Load route icon bitmaps from font data + metadata.
-    fn load_route_icons(font_data: &HashMap<String, serde_json::Value>) -> HashMap<String, RouteIcon> {
+    ///
+    /// Icons named `ROUTE_{route}_{CIRCLE|DIAMOND}` are bucketed by shape and
+    /// keyed by bare route ID, so lookups never build a name string.
+    /// Returns (circles, diamonds).
+    fn load_route_icons(
+        font_data: &HashMap<&str, serde_json::Value>,
+    ) -> (HashMap<String, RouteIcon>, HashMap<String, RouteIcon>) {
         let metadata: HashMap<String, IconMeta> =
             serde_json::from_str(ICON_METADATA_JSON).expect("embedded icon metadata is valid");
 
-        let mut icons = HashMap::new();
+        let mut circles = HashMap::new();
+        let mut diamonds = HashMap::new();
 
         for (name, meta) in &metadata {
-            let Some(rows_value) = font_data.get(name) else {
+            let Some((route, shape)) = name
+                .strip_prefix("ROUTE_")
+                .and_then(|rest| rest.rsplit_once('_'))
+            else {
+                continue;
+            };
+            let icons = match shape {
+                "CIRCLE" => &mut circles,
+                "DIAMOND" => &mut diamonds,
+                _ => continue,
+            };
+
+            let Some(rows_value) = font_data.get(name.as_str()) else {
                 continue;
             };
             let Some(rows) = rows_value.as_array() else {
                 continue;
             };
 
-            let row_vals: Vec<u64> = rows.iter().filter_map(|v| v.as_u64()).collect();
-            if row_vals.len() != meta.height {
+            if meta.width == 0 || meta.width > 64 {
                 continue;
             }
 
-            let color = crate::display::colors::hex_to_rgb(&meta.color);
-
-            // Decode MSB-first: bit (width-1) = leftmost pixel
-            let mut pixels = Vec::with_capacity(meta.height);
-            for &row_val in &row_vals {
-                let mut row = Vec::with_capacity(meta.width);
-                for x in 0..meta.width {
-                    let bit = meta.width - 1 - x;
-                    if row_val & (1 << bit) != 0 {
-                        row.push((color.0, color.1, color.2, 255));
-                    } else {
-                        row.push((0, 0, 0, 0));
-                    }
-                }
-                pixels.push(row);
+            // Source rows are MSB-first (bit width-1 = leftmost pixel). Keep
+            // the low `width` bits and mirror them to LSB-first.
+            let mask = u64::MAX >> (64 - meta.width);
+            let icon_rows: CharBitmap = rows
+                .iter()
+                .filter_map(|v| v.as_u64())
+                .map(|row_val| (row_val & mask).reverse_bits() >> (64 - meta.width))
+                .collect();
+            if icon_rows.len() != meta.height {
+                continue;
             }
 
             icons.insert(
-                name.clone(),
+                route.to_string(),
                 RouteIcon {
-                    pixels,
+                    rows: icon_rows,
+                    color: crate::display::colors::hex_to_rgb(&meta.color),
                     width: meta.width,
                     baseline_offset: meta.baseline_offset,
                 },
             );
         }
 
-        icons
+        (circles, diamonds)
     }
 
-    /// Get the pre-decoded bitmap for a character.
+    /// Get the packed bitmap for a character.
     ///
     /// Returns None if the character is not in the font.
     /// Falls back to regular bitmap if italic variant doesn't exist.
     pub fn get_char_bitmap(&self, ch: char, italic: bool) -> Option<&CharBitmap> {
         if italic {
-            self.italic_decoded.get(&ch).or_else(|| self.chars_decoded.get(&ch))
+            self.italic.get(&ch).or_else(|| self.chars.get(&ch))
         } else {
-            self.chars_decoded.get(&ch)
+            self.chars.get(&ch)
         }
     }
 
+    /// Look up metrics, falling back to the regular style if the italic
+    /// variant doesn't exist.
+    fn glyph_metrics(&self, ch: char, italic: bool) -> Option<GlyphMetrics> {
+        self.metrics.get(ch, italic).or_else(|| self.metrics.get(ch, false))
+    }
+
     /// Get the width of a character in pixels.
     pub fn get_char_width(&self, ch: char, italic: bool) -> usize {
-        *self.char_widths.get(&(ch, italic))
-            .or_else(|| self.char_widths.get(&(ch, false)))
-            .unwrap_or(&4)
+        self.glyph_metrics(ch, italic).map_or(4, |m| m.width)
     }
 
     /// Get left padding (empty columns before first lit pixel).
     pub fn get_char_left_padding(&self, ch: char, italic: bool) -> usize {
-        *self.char_left_padding.get(&(ch, italic))
-            .or_else(|| self.char_left_padding.get(&(ch, false)))
-            .unwrap_or(&0)
+        self.glyph_metrics(ch, italic).map_or(0, |m| m.left_padding)
     }
 
     /// Measure the total width of a text string.
@@ -289,17 +313,11 @@ impl MtaFont {
     /// Returns the DIAMOND variant for express, CIRCLE for local.
     /// Falls back to CIRCLE if DIAMOND isn't available.
     pub fn get_route_icon(&self, route: &str, is_express: bool) -> Option<&RouteIcon> {
-        let shape = if is_express { "DIAMOND" } else { "CIRCLE" };
-        let name = format!("ROUTE_{}_{}", route, shape);
-
-        self.route_icons.get(&name).or_else(|| {
-            if is_express {
-                let fallback = format!("ROUTE_{}_CIRCLE", route);
-                self.route_icons.get(&fallback)
-            } else {
-                None
-            }
-        })
+        if is_express {
+            self.diamond_icons.get(route).or_else(|| self.circle_icons.get(route))
+        } else {
+            self.circle_icons.get(route)
+        }
     }
 
 }
@@ -307,7 +325,6 @@ impl MtaFont {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use crate::display::colors::Rgb;
 
     #[test]
     fn test_font_loads() {
@@ -324,7 +341,7 @@ mod tests {
         let bitmap = font.get_char_bitmap('A', false).expect("A should exist");
         assert_eq!(bitmap.len(), FONT_HEIGHT, "A should have {FONT_HEIGHT} rows");
         // A's first row is 0 (empty), so no lit pixels
-        assert!(bitmap[0].iter().all(|&p| !p), "first row of A should be blank");
+        assert_eq!(bitmap[0], 0, "first row of A should be blank");
     }
 
     #[test]
@@ -356,8 +373,9 @@ mod tests {
         let italic = font.get_char_bitmap('A', true).unwrap();
         assert_eq!(regular.len(), italic.len(), "same number of rows");
         // Italic top half should be wider (shifted right)
-        let reg_top_width = regular[1].len(); // row 1 (row 0 is blank for A)
-        let ital_top_width = italic[1].len();
+        let bit_len = |row: u64| 64 - row.leading_zeros();
+        let reg_top_width = bit_len(regular[1]); // row 1 (row 0 is blank for A)
+        let ital_top_width = bit_len(italic[1]);
         assert!(
             ital_top_width >= reg_top_width,
             "italic top should be at least as wide"
@@ -373,12 +391,12 @@ mod tests {
         // Row 1 of 'A' has value 224
         // 224 = 0b11100000 → bits 5,6,7 set
         // LSB-first means bit 0 = x=0, bit 5 = x=5, etc.
-        let row1 = &bitmap[1];
-        assert!(!row1[0], "bit 0 should be off");
-        assert!(!row1[4], "bit 4 should be off");
-        assert!(row1[5], "bit 5 should be on");
-        assert!(row1[6], "bit 6 should be on");
-        assert!(row1[7], "bit 7 should be on");
+        let lit = |x: u32| bitmap[1] & (1 << x) != 0;
+        assert!(!lit(0), "bit 0 should be off");
+        assert!(!lit(4), "bit 4 should be off");
+        assert!(lit(5), "bit 5 should be on");
+        assert!(lit(6), "bit 6 should be on");
+        assert!(lit(7), "bit 7 should be on");
     }
 
     #[test]
@@ -399,8 +417,8 @@ mod tests {
         let font = get_font();
         let icon = font.get_route_icon("1", false).unwrap();
         assert_eq!(icon.width, 14);
-        assert_eq!(icon.pixels.len(), 13); // height
-        assert_eq!(icon.pixels[0].len(), 14);
+        assert_eq!(icon.rows.len(), 13); // height
+        assert!(icon.rows.iter().all(|&row| row >> icon.width == 0));
     }
 
     #[test]
@@ -415,17 +433,17 @@ mod tests {
         // Actually: for x in 0..14, pixel lit if bit (13-x) is set in 480
         // 480 = 0b0000000111100000
         // bit 13-0 = 480>>13 & 1 = 0, ..., bit 13-5 = 480>>8 & 1 = 1, etc.
-        let row0 = &icon.pixels[0];
+        let lit = |x: usize| icon.rows[0] & (1 << x) != 0;
         // 480 in binary is 111100000 (9 bits)
         // In 14-bit MSB: bits 5,6,7,8 are set
         // x=0: bit 13 → 0, x=1: bit 12 → 0, ..., x=5: bit 8 → 1, x=6: bit 7 → 1,
         // x=7: bit 6 → 1, x=8: bit 5 → 1, x=9: bit 4 → 0, ...
-        assert_eq!(row0[0].3, 0, "pixel 0 should be transparent");
-        assert_eq!(row0[5].3, 255, "pixel 5 should be opaque");
-        assert_eq!(row0[6].3, 255, "pixel 6 should be opaque");
-        assert_eq!(row0[7].3, 255, "pixel 7 should be opaque");
-        assert_eq!(row0[8].3, 255, "pixel 8 should be opaque");
-        assert_eq!(row0[9].3, 0, "pixel 9 should be transparent");
+        assert!(!lit(0), "pixel 0 should be transparent");
+        assert!(lit(5), "pixel 5 should be opaque");
+        assert!(lit(6), "pixel 6 should be opaque");
+        assert!(lit(7), "pixel 7 should be opaque");
+        assert!(lit(8), "pixel 8 should be opaque");
+        assert!(!lit(9), "pixel 9 should be transparent");
     }
 
     #[test]
@@ -436,6 +454,42 @@ mod tests {
         // Route 4 has DIAMOND → should return it
         let diamond = font.get_route_icon("4", true).unwrap();
         assert_eq!(diamond.width, 14);
+        // Unknown routes have neither shape
+        assert!(font.get_route_icon("ROUTE_4", true).is_none());
+    }
+
+    #[test]
+    fn test_metrics_table_lookup() {
+        let mut table = GlyphMetricsTable::new();
+        let m = GlyphMetrics { width: 7, left_padding: 1 };
+        table.insert('A', true, m);
+        table.insert('\u{00E9}', false, m);
+        assert_eq!(table.get('A', true).map(|m| m.width), Some(7));
+        assert!(table.get('A', false).is_none());
+        assert_eq!(table.get('\u{00E9}', false).map(|m| m.left_padding), Some(1));
+
+        // Unknown glyphs use the defaults
+        let font = get_font();
+        assert_eq!(font.get_char_width('\u{2603}', false), 4);
+        assert_eq!(font.get_char_left_padding('\u{2603}', true), 0);
+    }
+
+    #[test]
+    fn test_compute_metrics() {
+        // 1548 = 0b11000001100: widest row spans 11 columns, first lit at 2
+        let m = MtaFont::compute_metrics('A', &[0, 224, 1548]);
+        assert_eq!((m.width, m.left_padding), (11, 2));
+        // Matches the widest row
+        let font = get_font();
+        for ch in ['A', 'i', 'W', '1', '.'] {
+            let bitmap = font.get_char_bitmap(ch, false).unwrap();
+            let widest = bitmap.iter().map(|row| (64 - row.leading_zeros() as usize).max(1));
+            assert_eq!(font.get_char_width(ch, false), widest.max().unwrap(), "width of {ch:?}");
+        }
+        // Blank and empty glyphs
+        assert_eq!(MtaFont::compute_metrics('x', &[0, 0]).width, 1);
+        assert_eq!(MtaFont::compute_metrics('x', &[]).width, 4);
+        assert_eq!(MtaFont::compute_metrics(' ', &[0, 0]).width, 4);
     }
 
     #[test]
@@ -471,9 +525,9 @@ mod tests {
         let mut x_offset: i32 = 0;
         for ch in text.chars() {
             if let Some(bitmap) = font.get_char_bitmap(ch, italic) {
-                for (y, row) in bitmap.iter().enumerate() {
-                    for (x, &lit) in row.iter().enumerate() {
-                        if lit {
+                for (y, &row) in bitmap.iter().enumerate() {
+                    for x in 0..64 {
+                        if row & (1 << x) != 0 {
                             let px = x_offset as usize + x;
                             if px < width {
                                 for sy in 0..scale {
@@ -508,12 +562,13 @@ mod tests {
     /// Render a route icon to a flat RGB pixel buffer, returns (width, height, pixels).
     fn render_icon_to_pixels(icon: &RouteIcon, scale: usize) -> (usize, usize, Vec<u8>) {
         let w = icon.width * scale;
-        let h = icon.pixels.len() * scale;
+        let h = icon.rows.len() * scale;
         let mut pixels = vec![0u8; w * h * 3];
+        let (r, g, b) = icon.color;
 
-        for (y, row) in icon.pixels.iter().enumerate() {
-            for (x, &(r, g, b, a)) in row.iter().enumerate() {
-                if a > 0 {
+        for (y, &row) in icon.rows.iter().enumerate() {
+            for x in 0..icon.width {
+                if row & (1 << x) != 0 {
                     for sy in 0..scale {
                         for sx in 0..scale {
                             let idx = ((y * scale + sy) * w + x * scale + sx) * 3;
@@ -30,6 +30,11 @@ impl FrameBuffer {
         }
     }
 
+    /// Reset every pixel to black, keeping the allocation.
+    pub fn clear(&mut self) {
+        self.pixels.fill(0);
+    }
+
     pub fn width(&self) -> usize {
         self.width
     }
@@ -65,28 +70,53 @@ impl FrameBuffer {
 
     /// Draw a character bitmap at (x, y) with the given color.
     ///
-    /// The bitmap is from `MtaFont::get_char_bitmap()` — LSB-first decoded
-    /// where each row is a `Vec<bool>` of lit pixels.
+    /// The bitmap is from `MtaFont::get_char_bitmap()` — one packed row per
+    /// line, LSB-first. Only set bits are visited: each step takes the lowest
+    /// set bit as the column and then clears it.
     pub fn blit_char(&mut self, bitmap: &CharBitmap, x: i32, y: i32, color: Rgb) {
-        for (row_idx, row) in bitmap.iter().enumerate() {
+        for (row_idx, &row) in bitmap.iter().enumerate() {
             let py = y + row_idx as i32;
-            for (col_idx, &lit) in row.iter().enumerate() {
-                if lit {
-                    self.set_pixel(x + col_idx as i32, py, color);
-                }
+            let mut bits = row;
+            while bits != 0 {
+                let col = bits.trailing_zeros() as i32;
+                self.set_pixel(x + col, py, color);
+                bits &= bits - 1;
             }
         }
     }
 
     /// Draw a route icon at (x, y) with alpha compositing.
     ///
-    /// Icons use 1-bit alpha: pixels with a > 0 overwrite the destination.
+    /// Icons use 1-bit alpha: opaque pixels overwrite the destination in the
+    /// icon's color. Rows share the glyph layout, so this is a colored blit.
     pub fn blit_icon(&mut self, icon: &RouteIcon, x: i32, y: i32) {
-        for (row_idx, row) in icon.pixels.iter().enumerate() {
-            let py = y + row_idx as i32;
-            for (col_idx, &(r, g, b, a)) in row.iter().enumerate() {
-                if a > 0 {
-                    self.set_pixel(x + col_idx as i32, py, (r, g, b));
+        self.blit_char(&icon.rows, x, y, icon.color);
+    }
+
+    /// Composite another framebuffer onto this one at (x, y).
+    ///
+    /// Non-black source pixels overwrite. The visible rectangle is clipped
+    /// once up front, then each row is copied as a contiguous slice.
+    pub fn blit_buffer(&mut self, src: &FrameBuffer, x: i32, y: i32) {
+        let x0 = x.max(0);
+        let y0 = y.max(0);
+        let x1 = (x + src.width as i32).min(self.width as i32);
+        let y1 = (y + src.height as i32).min(self.height as i32);
+        if x0 >= x1 || y0 >= y1 {
+            return;
+        }
+
+        let src_x = (x0 - x) as usize;
+        let len = (x1 - x0) as usize * 3;
+        for dy in y0 as usize..y1 as usize {
+            let sy = (dy as i32 - y) as usize;
+            let s = (sy * src.width + src_x) * 3;
+            let d = (dy * self.width + x0 as usize) * 3;
+            let src_row = &src.pixels[s..s + len];
+            let dst_row = &mut self.pixels[d..d + len];
+            for (dp, sp) in dst_row.chunks_exact_mut(3).zip(src_row.chunks_exact(3)) {
+                if sp != [0, 0, 0] {
+                    dp.copy_from_slice(sp);
                 }
             }
         }
@@ -162,6 +192,15 @@ mod tests {
         assert_eq!(fb.get_pixel(0, 0), (0, 0, 0));
     }
 
+    #[test]
+    fn test_clear() {
+        let mut fb = FrameBuffer::with_size(10, 10);
+        fb.set_pixel(5, 3, (255, 128, 64));
+        fb.clear();
+        assert_eq!(fb.get_pixel(5, 3), (0, 0, 0));
+        assert_eq!(fb.raw_pixels().len(), 10 * 10 * 3);
+    }
+
     #[test]
     fn test_out_of_bounds_ignored() {
         let mut fb = FrameBuffer::with_size(10, 10);
@@ -193,6 +232,19 @@ mod tests {
         assert!(found_green, "should have drawn some green pixels");
     }
 
+    #[test]
+    fn test_blit_char_packed_rows() {
+        let mut fb = FrameBuffer::with_size(10, 3);
+        let bitmap: CharBitmap = vec![0b101, 0, 1 << 9];
+        fb.blit_char(&bitmap, 1, 0, (0, 255, 0));
+        assert_eq!(fb.get_pixel(1, 0), (0, 255, 0));
+        assert_eq!(fb.get_pixel(2, 0), (0, 0, 0));
+        assert_eq!(fb.get_pixel(3, 0), (0, 255, 0));
+        assert!((0..10).all(|x| fb.get_pixel(x, 1) == (0, 0, 0)));
+        // Column 10 is clipped
+        assert!((0..10).all(|x| fb.get_pixel(x, 2) == (0, 0, 0)));
+    }
+
     #[test]
     fn test_blit_icon() {
         let mut fb = FrameBuffer::new();
@@ -202,10 +254,10 @@ mod tests {
 
         // Check that some pixels were drawn with the icon's color
         let mut found_icon_pixel = false;
-        for y in 5..(5 + icon.pixels.len()) {
+        for y in 5..(5 + icon.rows.len()) {
             for x in 10..(10 + icon.width) {
                 let px = fb.get_pixel(x, y);
-                if px != (0, 0, 0) {
+                if px == icon.color {
                     found_icon_pixel = true;
                     break;
                 }
@@ -214,6 +266,32 @@ mod tests {
         assert!(found_icon_pixel, "icon should have drawn some pixels");
     }
 
+    #[test]
+    fn test_blit_buffer_clips_and_skips_black() {
+        let mut src = FrameBuffer::with_size(4, 2);
+        src.set_pixel(0, 0, (255, 0, 0));
+        src.set_pixel(3, 1, (0, 0, 255));
+
+        let mut fb = FrameBuffer::with_size(10, 10);
+        fb.set_pixel(2, 2, (0, 255, 0));
+        fb.blit_buffer(&src, 1, 2);
+        assert_eq!(fb.get_pixel(1, 2), (255, 0, 0));
+        assert_eq!(fb.get_pixel(4, 3), (0, 0, 255));
+        // Black source pixels leave the destination untouched
+        assert_eq!(fb.get_pixel(2, 2), (0, 255, 0));
+
+        // Partially off-screen on the left and bottom
+        let mut fb = FrameBuffer::with_size(10, 10);
+        fb.blit_buffer(&src, -3, 9);
+        assert_eq!(fb.get_pixel(0, 9), (0, 0, 0));
+        fb.blit_buffer(&src, -3, 8);
+        assert_eq!(fb.get_pixel(0, 9), (0, 0, 255));
+
+        // Fully off-screen is a no-op
+        fb.blit_buffer(&src, 20, 0);
+        fb.blit_buffer(&src, -4, 0);
+    }
+
     #[test]
     fn test_raw_pixels_size() {
         let fb = FrameBuffer::new();
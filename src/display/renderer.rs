@@ -11,6 +11,8 @@ const CHAR_SPACING: i32 = -1;
 
 /// Width of a route icon (circle/diamond) in pixels.
 const ICON_WIDTH: i32 = 14;
+/// Number of trains the bottom row cycles through (trains #2 through #7).
+const CYCLING_TRAIN_COUNT: usize = 6;
 /// Sentinel value for "no train data" in the minutes field.
 const EMPTY_TRAIN_SENTINEL: i32 = 999;
 /// Y offset of the top train row (shifted up to align with V1 sign).
@@ -38,7 +40,7 @@ const ICON_ICON_GAP: i32 = 1;
 pub struct Renderer {
     /// Track width of last rendered alert for scroll completion.
     last_alert_width: i32,
-    /// Cached alert rendering: (text, affected_routes_key) → pre-rendered pixels.
+    /// Cached alert rendering: text → pre-rendered pixels.
     alert_cache: Option<AlertCacheEntry>,
     /// Regex for matching `[route]` patterns in alert text.
     route_pattern: Regex,
@@ -46,7 +48,6 @@ pub struct Renderer {
 
 struct AlertCacheEntry {
     text: String,
-    routes_key: String,
     /// Pre-rendered alert as a small framebuffer (variable width x 17 height).
     buffer: FrameBuffer,
 }
@@ -64,36 +65,38 @@ impl Renderer {
         }
     }
 
-    /// Render a complete frame.
+    /// Render a complete frame into `fb`, overwriting its previous contents.
     ///
-    /// This is the main entry point called at 60fps.
+    /// This is the main entry point called at 60fps. The caller owns the
+    /// framebuffer and reuses it across frames, so no pixel buffer is
+    /// allocated per frame.
+    #[allow(clippy::too_many_arguments)]
     pub fn render_frame(
         &mut self,
+        fb: &mut FrameBuffer,
         snapshot: &DisplaySnapshot,
         cycle_index: usize,
         flash_state: bool,
         alert_scroll_offset: f32,
         show_alert: bool,
         current_alert: Option<&Alert>,
-    ) -> FrameBuffer {
-        let mut fb = FrameBuffer::new();
+    ) {
+        fb.clear();
 
         // Top row: next arriving train (any direction)
         let first_train = snapshot.get_first_train();
-        self.render_train_row(&mut fb, first_train, 0, 1, flash_state);
+        self.render_train_row(fb, first_train, 0, 1, flash_state);
 
         // Bottom row: cycling train OR scrolling alert
         if show_alert {
             if let Some(alert) = current_alert {
-                self.render_alert_row(&mut fb, alert, alert_scroll_offset);
+                self.render_alert_row(fb, alert, alert_scroll_offset);
             }
         } else {
-            let cycling = snapshot.get_cycling_trains(6);
-            let idx = cycle_index.min(cycling.len().saturating_sub(1));
-            self.render_train_row(&mut fb, &cycling[idx], BOTTOM_ROW_Y, idx + 2, false);
+            let idx = cycle_index.min(CYCLING_TRAIN_COUNT - 1);
+            let train = snapshot.get_cycling_train(idx);
+            self.render_train_row(fb, train, BOTTOM_ROW_Y, idx + 2, false);
         }
-
-        fb
     }
 
     /// Render a single train row at the given y_offset.
@@ -144,7 +147,7 @@ impl Renderer {
         // Truncate destination to fit between icon and time
         let available_width = (time_x - station_x - TIME_RIGHT_MARGIN).max(0) as usize;
         let dest_text = self.truncate_text(font, &train.destination, available_width);
-        fb.draw_text(&dest_text, station_x, y + 4, text_color, false, CHAR_SPACING);
+        fb.draw_text(dest_text, station_x, y + 4, text_color, false, CHAR_SPACING);
 
         // Draw time
         fb.draw_text(&time_text, time_x, y + 4, time_color, false, CHAR_SPACING);
@@ -157,11 +160,10 @@ impl Renderer {
         alert: &Alert,
         scroll_offset: f32,
     ) {
-        let routes_key = Self::routes_key(&alert.affected_routes);
-
-        // Check cache
+        // Check cache. Rendering depends only on the text (icons come from the
+        // inline `[route]` markers), so one string comparison decides a hit.
         let need_render = match &self.alert_cache {
-            Some(cached) => cached.text != alert.text || cached.routes_key != routes_key,
+            Some(cached) => cached.text != alert.text,
             None => true,
         };
 
@@ -170,7 +172,6 @@ impl Renderer {
             self.last_alert_width = alert_buf.width() as i32;
             self.alert_cache = Some(AlertCacheEntry {
                 text: alert.text.clone(),
-                routes_key,
                 buffer: alert_buf,
             });
         }
@@ -182,7 +183,7 @@ impl Renderer {
 
         // Only render if still visible (y=15 to fit 17px tall alert in bottom half)
         if x_pos > -(alert_buf.width() as i32) {
-            self.blit_framebuffer(fb, alert_buf, x_pos, ALERT_ROW_Y);
+            fb.blit_buffer(alert_buf, x_pos, ALERT_ROW_Y);
         }
     }
 
@@ -257,12 +258,7 @@ impl Renderer {
             let cur_type = part.part_type();
 
             // Context-aware gap
-            x_pos += match (prev_type, cur_type) {
-                (PartType::Icon, PartType::Text) => ICON_TO_TEXT_GAP,
-                (PartType::Icon, PartType::Icon) => ICON_ICON_GAP,
-                (PartType::Text, PartType::Icon) => TEXT_TO_ICON_GAP,
-                _ => 0,
-            };
+            x_pos += part_gap(prev_type, cur_type);
 
             match part {
                 RenderedPart::Text(t, _w) => {
@@ -307,43 +303,32 @@ impl Renderer {
     }
 
     /// Truncate text to fit within max_width pixels.
-    fn truncate_text(&self, font: &MtaFont, text: &str, max_width: usize) -> String {
+    ///
+    /// Returns a prefix slice of `text`; binary-search probes measure
+    /// borrowed prefixes, so nothing is allocated.
+    fn truncate_text<'a>(&self, font: &MtaFont, text: &'a str, max_width: usize) -> &'a str {
         if font.measure_text(text, CHAR_SPACING, false) <= max_width {
-            return text.to_string();
+            return text;
         }
 
+        // Prefix of the first `n` characters
+        let prefix = |n: usize| match text.char_indices().nth(n) {
+            Some((end, _)) => &text[..end],
+            None => text,
+        };
+
         let char_count = text.chars().count();
         let mut lo: usize = 0;
         let mut hi: usize = char_count;
         while lo < hi {
             let mid = (lo + hi).div_ceil(2);
-            let candidate: String = text.chars().take(mid).collect();
-            if font.measure_text(&candidate, CHAR_SPACING, false) <= max_width {
+            if font.measure_text(prefix(mid), CHAR_SPACING, false) <= max_width {
                 lo = mid;
             } else {
                 hi = mid - 1;
             }
         }
-        text.chars().take(lo).collect()
-    }
-
-    /// Blit one framebuffer onto another at (x, y). Non-black pixels overwrite.
-    fn blit_framebuffer(&self, dst: &mut FrameBuffer, src: &FrameBuffer, x: i32, y: i32) {
-        for sy in 0..src.height() {
-            for sx in 0..src.width() {
-                let px = src.get_pixel(sx, sy);
-                if px != (0, 0, 0) {
-                    dst.set_pixel(x + sx as i32, y + sy as i32, px);
-                }
-            }
-        }
-    }
-
-    /// Build a stable string key from a set of routes (for cache comparison).
-    fn routes_key(routes: &std::collections::HashSet<String>) -> String {
-        let mut sorted: Vec<&str> = routes.iter().map(|s| s.as_str()).collect();
-        sorted.sort();
-        sorted.join(",")
+        prefix(lo)
     }
 
     /// Measure total width of rendered alert parts with context-aware spacing.
@@ -353,14 +338,7 @@ impl Renderer {
             let prev_type = if i > 0 { parts[i - 1].part_type() } else { PartType::None };
             let cur_type = part.part_type();
 
-            total += match (prev_type, cur_type) {
-                (PartType::Icon, PartType::Text) => ICON_TO_TEXT_GAP,
-                (PartType::Icon, PartType::Icon) => ICON_ICON_GAP,
-                (PartType::Text, PartType::Icon) => TEXT_TO_ICON_GAP,
-                _ => 0,
-            };
-
-            total += part.width() as i32;
+            total += part_gap(prev_type, cur_type) + part.width() as i32;
         }
         total.max(0) as usize
     }
@@ -387,6 +365,16 @@ enum PartType {
     Icon,
 }
 
+/// Horizontal gap inserted between two adjacent alert parts.
+fn part_gap(prev: PartType, cur: PartType) -> i32 {
+    match (prev, cur) {
+        (PartType::Icon, PartType::Text) => ICON_TO_TEXT_GAP,
+        (PartType::Icon, PartType::Icon) => ICON_ICON_GAP,
+        (PartType::Text, PartType::Icon) => TEXT_TO_ICON_GAP,
+        _ => 0,
+    }
+}
+
 impl RenderedPart {
     fn part_type(&self) -> PartType {
         match self {
@@ -434,7 +422,8 @@ mod tests {
             fetched_at: 1000.0,
         };
 
-        let fb = renderer.render_frame(&snapshot, 0, false, 0.0, false, None);
+        let mut fb = FrameBuffer::new();
+        renderer.render_frame(&mut fb, &snapshot, 0, false, 0.0, false, None);
         assert_eq!(fb.width(), 192);
         assert_eq!(fb.height(), 32);
 
@@ -458,7 +447,8 @@ mod tests {
     fn test_render_frame_empty_snapshot() {
         let mut renderer = Renderer::new();
         let snapshot = DisplaySnapshot::empty();
-        let fb = renderer.render_frame(&snapshot, 0, false, 0.0, false, None);
+        let mut fb = FrameBuffer::new();
+        renderer.render_frame(&mut fb, &snapshot, 0, false, 0.0, false, None);
         assert_eq!(fb.width(), 192);
         assert_eq!(fb.height(), 32);
     }
@@ -473,9 +463,11 @@ mod tests {
         };
 
         // Flash on — time should be black (invisible)
-        let fb_on = renderer.render_frame(&snapshot, 0, true, 0.0, false, None);
+        let mut fb_on = FrameBuffer::new();
+        renderer.render_frame(&mut fb_on, &snapshot, 0, true, 0.0, false, None);
         // Flash off — time should be red
-        let fb_off = renderer.render_frame(&snapshot, 0, false, 0.0, false, None);
+        let mut fb_off = FrameBuffer::new();
+        renderer.render_frame(&mut fb_off, &snapshot, 0, false, 0.0, false, None);
 
         // The two frames should differ (flash state changes pixel colors)
         let mut differs = false;
@@ -493,6 +485,31 @@ mod tests {
         assert!(differs, "flash on/off frames should differ for arriving train");
     }
 
+    #[test]
+    fn test_render_frame_reused_buffer_matches_fresh() {
+        let mut renderer = Renderer::new();
+        let alert = Alert {
+            text: "Delays on [1] trains".into(),
+            affected_routes: HashSet::new(),
+            priority: 1,
+            alert_id: "test".into(),
+        };
+        let snapshot = DisplaySnapshot {
+            trains: vec![make_train("1", "Test", 5, false)],
+            alerts: vec![alert.clone()],
+            fetched_at: 0.0,
+        };
+
+        // Draw an alert frame first, then a train frame into the same buffer
+        let mut reused = FrameBuffer::new();
+        renderer.render_frame(&mut reused, &snapshot, 0, false, 100.0, true, Some(&alert));
+        renderer.render_frame(&mut reused, &snapshot, 0, false, 0.0, false, None);
+
+        let mut fresh = FrameBuffer::new();
+        renderer.render_frame(&mut fresh, &snapshot, 0, false, 0.0, false, None);
+        assert_eq!(reused.raw_pixels(), fresh.raw_pixels());
+    }
+
     #[test]
     fn test_render_alert_with_icons() {
         let renderer = Renderer::new();
@@ -505,6 +522,15 @@ mod tests {
         assert_eq!(buf.height(), 17);
     }
 
+    #[test]
+    fn test_part_gap() {
+        assert_eq!(part_gap(PartType::None, PartType::Icon), 0);
+        assert_eq!(part_gap(PartType::Text, PartType::Text), 0);
+        assert_eq!(part_gap(PartType::Text, PartType::Icon), TEXT_TO_ICON_GAP);
+        assert_eq!(part_gap(PartType::Icon, PartType::Icon), ICON_ICON_GAP);
+        assert_eq!(part_gap(PartType::Icon, PartType::Text), ICON_TO_TEXT_GAP);
+    }
+
     #[test]
     fn test_render_alert_no_icons() {
         let renderer = Renderer::new();
@@ -523,9 +549,15 @@ mod tests {
         let text = "Van Cortlandt Park-242 St";
         let truncated = renderer.truncate_text(font, text, 80);
         assert!(
-            font.measure_text(&truncated, CHAR_SPACING, false) <= 80,
+            font.measure_text(truncated, CHAR_SPACING, false) <= 80,
             "truncated text should fit within 80px"
         );
+        assert!(text.starts_with(truncated));
+        assert!(
+            font.measure_text(&text[..truncated.len() + 1], CHAR_SPACING, false) > 80,
+            "one more character should not fit"
+        );
+        assert_eq!(renderer.truncate_text(font, "Bédford Av", 0), "");
 
         // Short text should not be truncated
         let short = "42 St";
@@ -552,7 +584,8 @@ mod tests {
         };
 
         // Render a frame with alert to populate last_alert_width
-        renderer.render_frame(&snapshot, 0, false, 0.0, true, Some(&alert));
+        let mut fb = FrameBuffer::new();
+        renderer.render_frame(&mut fb, &snapshot, 0, false, 0.0, true, Some(&alert));
 
         let dist = renderer.get_scroll_complete_distance();
         assert!(dist > 192, "scroll distance should exceed screen width");
@@ -578,8 +611,10 @@ mod tests {
         };
 
         // Render at different scroll positions
-        let fb1 = renderer.render_frame(&snapshot, 0, false, 0.0, true, Some(&alert));
-        let fb2 = renderer.render_frame(&snapshot, 0, false, 50.0, true, Some(&alert));
+        let mut fb1 = FrameBuffer::new();
+        renderer.render_frame(&mut fb1, &snapshot, 0, false, 0.0, true, Some(&alert));
+        let mut fb2 = FrameBuffer::new();
+        renderer.render_frame(&mut fb2, &snapshot, 0, false, 50.0, true, Some(&alert));
 
         // The bottom halves should differ (alert scrolled)
         let mut differs = false;
@@ -613,7 +648,8 @@ mod tests {
             fetched_at: 1000.0,
         };
 
-        let fb = renderer.render_frame(&snapshot, 0, false, 0.0, false, None);
+        let mut fb = FrameBuffer::new();
+        renderer.render_frame(&mut fb, &snapshot, 0, false, 0.0, false, None);
 
         // Write at 4x scale for visibility
         let scale = 4usize;
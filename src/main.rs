@@ -16,6 +16,7 @@ use tokio_util::sync::CancellationToken;
 use tracing::{error, info, warn};
 
 use config::Config;
+use display::framebuffer::FrameBuffer;
 use display::matrix::create_display;
 use display::renderer::Renderer;
 use models::{Alert, DisplaySnapshot};
@@ -32,6 +33,27 @@ pub struct AppState {
     pub config_changed: tokio::sync::Notify,
     pub last_fetch_success: AtomicU64,
     pub last_render_tick: AtomicU64,
+    /// Mtime of the config file the running config was loaded from or saved to.
+    pub config_mtime: ArcSwap<ConfigMtime>,
+}
+
+/// Config file modification time, with the RFC 3339 form served by the web API.
+#[derive(Default)]
+pub struct ConfigMtime {
+    pub modified: Option<SystemTime>,
+    pub rfc3339: Option<String>,
+}
+
+impl AppState {
+    /// Record the mtime of the config file just applied, formatting it once.
+    ///
+    /// The config watcher compares against this, so a file written by the web
+    /// handler (which records its own mtime) is not reloaded a second time.
+    pub fn set_config_mtime(&self, modified: Option<SystemTime>) {
+        let rfc3339 = modified.map(|t| chrono::DateTime::<chrono::Local>::from(t).to_rfc3339());
+        self.config_mtime
+            .store(Arc::new(ConfigMtime { modified, rfc3339 }));
+    }
 }
 
 /// Current time as seconds since the Unix epoch.
@@ -75,6 +97,10 @@ async fn main() {
         }
     };
 
+    // Ensure the station database is parsed once here, before the web and
+    // fetch tasks start, rather than inside whichever request touches it first
+    let _ = mta::stations::get_station_database();
+
     // Build shared state
     let state = Arc::new(AppState {
         config: ArcSwap::from_pointee(initial_config.clone()),
@@ -85,7 +111,9 @@ async fn main() {
         config_changed: tokio::sync::Notify::new(),
         last_fetch_success: AtomicU64::new(0),
         last_render_tick: AtomicU64::new(0),
+        config_mtime: ArcSwap::from_pointee(ConfigMtime::default()),
     });
+    state.set_config_mtime(config::config_mtime(&config_path));
 
     // Spawn fetch task
     let fetch_state = Arc::clone(&state);
@@ -148,25 +176,54 @@ fn find_config_path() -> PathBuf {
     PathBuf::from("config.json")
 }
 
+/// Stop IDs and route set derived from a config.
+///
+/// Train and alert fetches both need these; they are rebuilt only when the
+/// config is swapped rather than on every tick.
+struct FetchTargets {
+    config: Arc<Config>,
+    stop_ids: Vec<String>,
+    routes: HashSet<String>,
+}
+
+impl FetchTargets {
+    fn new(config: Arc<Config>) -> Self {
+        let stop_ids = config
+            .station_stops
+            .iter()
+            .flat_map(|(up, down)| [up.clone(), down.clone()])
+            .collect();
+        let routes = config.routes.iter().cloned().collect();
+        FetchTargets {
+            config,
+            stop_ids,
+            routes,
+        }
+    }
+
+    /// Rebuild from the live config if it changed since the last call.
+    fn refresh(&mut self, state: &AppState) {
+        let current = state.config.load_full();
+        if !Arc::ptr_eq(&current, &self.config) {
+            *self = Self::new(current);
+        }
+    }
+}
+
 /// Fetch trains for the current config and update the snapshot.
 async fn do_train_fetch(
     client: &mut MtaClient,
     state: &AppState,
+    targets: &FetchTargets,
     cached_alerts: &[models::Alert],
     last_train_count: &mut i32,
 ) {
-    let config = state.config.load();
-
-    let all_stop_ids: Vec<String> = config
-        .station_stops
-        .iter()
-        .flat_map(|(up, down)| vec![up.clone(), down.clone()])
-        .collect();
-
-    let routes: HashSet<String> = config.routes.iter().cloned().collect();
-
     let trains = client
-        .fetch_trains(&all_stop_ids, &routes, config.display.max_trains as usize)
+        .fetch_trains(
+            &targets.stop_ids,
+            &targets.routes,
+            targets.config.display.max_trains as usize,
+        )
         .await;
 
     let train_count = trains.len() as i32;
@@ -200,6 +257,7 @@ async fn fetch_task(state: Arc<AppState>) {
     };
     let mut last_train_count: i32 = -1;
     let mut cached_alerts: Vec<models::Alert> = Vec::new();
+    let mut targets = FetchTargets::new(state.config.load_full());
 
     info!("[FETCH] Background fetch task started");
 
@@ -223,31 +281,36 @@ async fn fetch_task(state: Arc<AppState>) {
             }
             _ = state.config_changed.notified() => {
                 info!("[FETCH] Config changed — re-fetching");
-                do_train_fetch(&mut client, &state, &cached_alerts, &mut last_train_count).await;
+                targets.refresh(&state);
+                do_train_fetch(&mut client, &state, &targets, &cached_alerts, &mut last_train_count).await;
             }
             _ = alert_interval.tick() => {
-                let config = state.config.load();
-                if config.display.show_alerts {
-                    let routes: HashSet<String> = config.routes.iter().cloned().collect();
-                    let raw_alerts = client.fetch_alerts(&routes).await;
+                targets.refresh(&state);
+                if targets.config.display.show_alerts {
+                    let raw_alerts = client.fetch_alerts(&targets.routes).await;
                     let mut am = state.alert_manager.lock()
                         .unwrap_or_else(|e| e.into_inner());
                     cached_alerts = am.filter_and_sort(&raw_alerts);
                 }
             }
             _ = train_interval.tick() => {
-                do_train_fetch(&mut client, &state, &cached_alerts, &mut last_train_count).await;
+                targets.refresh(&state);
+                do_train_fetch(&mut client, &state, &targets, &cached_alerts, &mut last_train_count).await;
             }
         }
     }
 }
 
+/// Whether the config file's current mtime differs from the one last applied.
+fn config_needs_reload(current: Option<SystemTime>, applied: &ConfigMtime) -> bool {
+    current != applied.modified
+}
+
 /// Config watcher — polls config file mtime every 5 seconds.
+///
+/// Reloads only when the mtime differs from the one recorded in `AppState`,
+/// so saves made through the web API don't trigger a redundant reload.
 async fn config_watcher_task(state: Arc<AppState>) {
-    let mut last_mtime = std::fs::metadata(&state.config_path)
-        .and_then(|m| m.modified())
-        .ok();
-
     let mut interval = tokio::time::interval(std::time::Duration::from_secs(5));
 
     loop {
@@ -257,11 +320,9 @@ async fn config_watcher_task(state: Arc<AppState>) {
                 break;
             }
             _ = interval.tick() => {
-                let current_mtime = std::fs::metadata(&state.config_path)
-                    .and_then(|m| m.modified())
-                    .ok();
+                let current_mtime = config::config_mtime(&state.config_path);
 
-                if current_mtime != last_mtime {
+                if config_needs_reload(current_mtime, &state.config_mtime.load()) {
                     info!("[CONFIG] File changed, reloading...");
                     match Config::load(&state.config_path) {
                         Ok(new_config) => {
@@ -271,8 +332,8 @@ async fn config_watcher_task(state: Arc<AppState>) {
                                 new_config.routes.join(",")
                             );
                             state.config.store(Arc::new(new_config));
+                            state.set_config_mtime(current_mtime);
                             state.config_changed.notify_one();
-                            last_mtime = current_mtime;
                         }
                         Err(e) => {
                             warn!("[CONFIG] Reload failed: {}", e);
@@ -424,6 +485,7 @@ fn render_loop(state: Arc<AppState>, running: Arc<AtomicBool>) {
     let mut display = create_display(brightness);
     let mut renderer = Renderer::new();
     let mut alert_state = AlertState::new();
+    let mut frame = FrameBuffer::new();
 
     let mut current_brightness = brightness;
     let mut cycle_index: usize = 0;
@@ -476,8 +538,9 @@ fn render_loop(state: Arc<AppState>, running: Arc<AtomicBool>) {
             MAX_ALERT_CYCLE_DURATION,
         );
 
-        // Render frame
-        let frame = renderer.render_frame(
+        // Render frame (reuses the same buffer every iteration)
+        renderer.render_frame(
+            &mut frame,
             &snapshot,
             cycle_index,
             flash_state,
@@ -609,6 +672,7 @@ mod tests {
             config_changed: tokio::sync::Notify::new(),
             last_fetch_success: AtomicU64::new(0),
             last_render_tick: AtomicU64::new(0),
+            config_mtime: ArcSwap::from_pointee(ConfigMtime::default()),
         })
     }
 
@@ -633,6 +697,41 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_set_config_mtime() {
+        let state = make_state(vec![]);
+        let t = SystemTime::UNIX_EPOCH + Duration::from_secs(1_700_000_000);
+
+        state.set_config_mtime(Some(t));
+        let mtime = state.config_mtime.load();
+        assert_eq!(mtime.modified, Some(t));
+        let formatted = mtime.rfc3339.as_deref().expect("rfc3339 should be set");
+        let parsed = chrono::DateTime::parse_from_rfc3339(formatted).unwrap();
+        assert_eq!(parsed.timestamp(), 1_700_000_000);
+
+        state.set_config_mtime(None);
+        let mtime = state.config_mtime.load();
+        assert_eq!(mtime.modified, None);
+        assert_eq!(mtime.rfc3339, None);
+    }
+
+    #[test]
+    fn test_config_needs_reload() {
+        let state = make_state(vec![]);
+        let t = SystemTime::UNIX_EPOCH + Duration::from_secs(1_700_000_000);
+
+        // Nothing recorded and no file: nothing to reload
+        assert!(!config_needs_reload(None, &state.config_mtime.load()));
+        assert!(config_needs_reload(Some(t), &state.config_mtime.load()));
+
+        // A recorded save (e.g. from update_config) is not reloaded again
+        state.set_config_mtime(Some(t));
+        assert!(!config_needs_reload(Some(t), &state.config_mtime.load()));
+        let later = t + Duration::from_secs(1);
+        assert!(config_needs_reload(Some(later), &state.config_mtime.load()));
+        assert!(config_needs_reload(None, &state.config_mtime.load()));
+    }
+
     #[test]
     fn test_alert_triggers_on_arrival() {
         let state = make_state(vec![make_alert("a1")]);
@@ -47,8 +47,9 @@ pub struct Alert {
 /// Complete immutable snapshot of all data needed to render a frame.
 ///
 /// Passed from the fetch task to the render thread via ArcSwap.
-/// Being fully immutable eliminates data races.
-#[derive(Debug, Clone)]
+/// Being fully immutable eliminates data races. Shared by `Arc`, never
+/// copied, so it deliberately does not implement `Clone`.
+#[derive(Debug)]
 pub struct DisplaySnapshot {
     pub trains: Vec<Train>,
     pub alerts: Vec<Alert>,
@@ -67,31 +68,25 @@ impl DisplaySnapshot {
 
     /// Get the next arriving train (any direction).
     pub fn get_first_train(&self) -> &Train {
-        static EMPTY_TRAIN: OnceLock<Train> = OnceLock::new();
-        self.trains.first().unwrap_or_else(||
-            EMPTY_TRAIN.get_or_init(Train::empty)
-        )
+        self.trains.first().unwrap_or_else(|| empty_train())
     }
 
-    /// Get trains #2 through #(count+1) for bottom row cycling.
-    /// Skips first train (shown on top row), takes next `count` trains.
-    pub fn get_cycling_trains(&self, count: usize) -> Vec<Train> {
-        let mut result: Vec<Train> = self
-            .trains
-            .iter()
-            .skip(1)
-            .take(count)
-            .cloned()
-            .collect();
-
-        // Pad with empty trains if needed
-        while result.len() < count {
-            result.push(Train::empty());
-        }
-        result
+    /// Get cycling train `index` (0-based) for the bottom row.
+    ///
+    /// Skips the first train (shown on top row). Positions past the end of the
+    /// list return a shared empty placeholder, so the render loop can call this
+    /// every frame without cloning or allocating.
+    pub fn get_cycling_train(&self, index: usize) -> &Train {
+        self.trains.get(index + 1).unwrap_or_else(|| empty_train())
     }
 }
 
+/// Shared placeholder for missing train slots.
+fn empty_train() -> &'static Train {
+    static EMPTY_TRAIN: OnceLock<Train> = OnceLock::new();
+    EMPTY_TRAIN.get_or_init(Train::empty)
+}
+
 /// A (uptown_stop_id, downtown_stop_id) platform pair.
 pub type StationStop = (String, String);
 
@@ -178,7 +173,7 @@ mod tests {
     }
 
     #[test]
-    fn test_get_cycling_trains_padding() {
+    fn test_get_cycling_train_padding() {
         let snap = DisplaySnapshot {
             trains: vec![Train {
                 route: "1".into(),
@@ -193,13 +188,13 @@ mod tests {
             fetched_at: 0.0,
         };
         // Only 1 train total, so cycling skips it → all padding
-        let cycling = snap.get_cycling_trains(6);
-        assert_eq!(cycling.len(), 6);
-        assert_eq!(cycling[0].minutes, 999); // all empty
+        for i in 0..6 {
+            assert_eq!(snap.get_cycling_train(i).minutes, 999); // all empty
+        }
     }
 
     #[test]
-    fn test_get_cycling_trains_with_data() {
+    fn test_get_cycling_train_with_data() {
         let mut trains = Vec::new();
         for i in 0..8 {
             trains.push(Train {
@@ -217,10 +212,9 @@ mod tests {
             alerts: Vec::new(),
             fetched_at: 0.0,
         };
-        let cycling = snap.get_cycling_trains(6);
-        assert_eq!(cycling.len(), 6);
-        assert_eq!(cycling[0].route, "2"); // skipped first train
-        assert_eq!(cycling[5].route, "7");
+        assert_eq!(snap.get_cycling_train(0).route, "2"); // skipped first train
+        assert_eq!(snap.get_cycling_train(5).route, "7");
+        assert_eq!(snap.get_cycling_train(7).minutes, 999); // past the end
     }
 
     #[test]
@@ -78,9 +78,7 @@ impl MtaClient {
         routes: &HashSet<String>,
         max_count: usize,
     ) -> Vec<Train> {
-        let feed_urls = feeds::feed_urls_for_routes(
-            &routes.iter().cloned().collect::<Vec<_>>(),
-        );
+        let feed_urls = feeds::feed_urls_for_routes(routes);
 
         let mut join_set = JoinSet::new();
 
@@ -251,11 +249,10 @@ impl MtaClient {
                         .collect::<Vec<_>>()
                         .join(" ");
 
-                    if !seen_texts.contains(&clean_text) {
-                        seen_texts.insert(clean_text.clone());
+                    if seen_texts.insert(clean_text.clone()) {
                         alert_objects.push(Alert {
                             text: clean_text,
-                            affected_routes: relevant.clone(),
+                            affected_routes: relevant,
                             priority,
                             alert_id: entity.id.clone(),
                         });
@@ -430,22 +427,23 @@ fn detect_express(
 }
 
 /// Remove duplicate trains (same route/destination within same minute).
+///
+/// Keeps the first occurrence in order. Keys borrow from the trains, so the
+/// seen-set costs no string copies.
 fn deduplicate_trains(trains: Vec<Train>) -> Vec<Train> {
-    let mut unique = Vec::new();
-    let mut seen: HashSet<(String, String, i32)> = HashSet::new();
-
-    for train in trains {
-        let key = (
-            train.route.clone(),
-            train.destination.clone(),
-            train.minutes,
-        );
-        if seen.insert(key) {
-            unique.push(train);
-        }
-    }
-
-    unique
+    let keep: Vec<bool> = {
+        let mut seen: HashSet<(&str, &str, i32)> = HashSet::new();
+        trains
+            .iter()
+            .map(|t| seen.insert((t.route.as_str(), t.destination.as_str(), t.minutes)))
+            .collect()
+    };
+
+    trains
+        .into_iter()
+        .zip(keep)
+        .filter_map(|(train, first)| first.then_some(train))
+        .collect()
 }
 
 #[cfg(test)]
@@ -33,11 +33,18 @@ pub(crate) const MTA_FEED_BASE_URL: &str =
     "https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs";
 
 /// Returns deduplicated feed URLs needed for a set of routes.
-pub fn feed_urls_for_routes(routes: &[String]) -> Vec<String> {
+///
+/// Accepts any collection of route IDs by reference, so callers holding a
+/// `HashSet<String>` don't have to copy it into a `Vec` first.
+pub fn feed_urls_for_routes<I, S>(routes: I) -> Vec<String>
+where
+    I: IntoIterator<Item = S>,
+    S: AsRef<str>,
+{
     let mut seen = std::collections::HashSet::new();
     let mut urls = Vec::new();
     for route in routes {
-        if let Some(suffix) = feed_id_for_route(route) {
+        if let Some(suffix) = feed_id_for_route(route.as_ref()) {
             if seen.insert(suffix) {
                 urls.push(format!("{}{}", MTA_FEED_BASE_URL, suffix));
             }
@@ -71,4 +78,16 @@ mod tests {
         // 1, 2, 3 share the same feed; A is separate
         assert_eq!(urls.len(), 2);
     }
+
+    #[test]
+    fn test_feed_urls_from_set() {
+        let routes: std::collections::HashSet<String> =
+            ["1".to_string(), "A".to_string(), "C".to_string(), "X".to_string()].into();
+        let mut urls = feed_urls_for_routes(&routes);
+        urls.sort();
+        assert_eq!(
+            urls,
+            vec![MTA_FEED_BASE_URL.to_string(), format!("{}-ace", MTA_FEED_BASE_URL)]
+        );
+    }
 }
@@ -1,6 +1,6 @@
 use regex::Regex;
 use serde::Deserialize;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::sync::OnceLock;
 
 /// Raw station record from the JSON database.
@@ -26,8 +26,17 @@ struct StationDb {
     stations: Vec<Station>,
     /// Lookup index: normalized name → index into `stations`.
     index: HashMap<String, usize>,
-    /// Reverse lookup: base stop ID (without N/S suffix) → station name.
-    stop_id_to_name: HashMap<String, String>,
+    /// Reverse lookup: base stop ID (without N/S suffix) → index into
+    /// `stations`. Names aren't copied per stop ID; lookups borrow them.
+    stop_id_to_station: HashMap<String, usize>,
+    /// Lowercased station names, parallel to `stations` (for search).
+    names_lower: Vec<String>,
+    /// Route ID → indices of stations serving it, in database order.
+    route_index: HashMap<String, Vec<usize>>,
+    /// Substring-match candidates as parallel arrays: index key with dashes
+    /// replaced by spaces, and the station it points to. Ordered by station.
+    search_names: Vec<String>,
+    search_indices: Vec<usize>,
 }
 
 static STATION_DB: OnceLock<StationDb> = OnceLock::new();
@@ -37,27 +46,56 @@ fn get_db() -> &'static StationDb {
         let stations: Vec<Station> =
             serde_json::from_str(STATION_DB_JSON).expect("embedded station DB is valid JSON");
 
+        // Build the name, search, route and reverse stop ID indices in one pass
         let mut index = HashMap::new();
+        let mut stop_id_to_station = HashMap::new();
+        let mut names_lower = Vec::with_capacity(stations.len());
+        let mut route_index: HashMap<String, Vec<usize>> = HashMap::new();
         for (i, station) in stations.iter().enumerate() {
             // Exact lowercase
-            index.insert(station.name.to_lowercase(), i);
+            let lower = station.name.to_lowercase();
+            index.insert(lower.clone(), i);
+            names_lower.push(lower);
             // Normalized form
             let normalized = normalize_station_name(&station.name);
             index.entry(normalized).or_insert(i);
-        }
 
-        // Build reverse index: base stop ID → station name
-        let mut stop_id_to_name = HashMap::new();
-        for station in &stations {
+            // Reverse index: base stop ID → station
             for sid in &station.stop_ids {
                 let base = sid.trim_end_matches(['N', 'S']);
-                stop_id_to_name
-                    .entry(base.to_string())
-                    .or_insert_with(|| station.name.clone());
+                stop_id_to_station.entry(base.to_string()).or_insert(i);
+            }
+
+            for route in &station.routes {
+                let entries = route_index.entry(route.clone()).or_default();
+                if entries.last() != Some(&i) {
+                    entries.push(i);
+                }
             }
         }
 
-        StationDb { stations, index, stop_id_to_name }
+        // Flatten the index once for the substring fallback so queries scan
+        // contiguous strings instead of re-deriving each key per lookup.
+        // Keys that collapse to the same text are kept once (first station
+        // wins, which is the one a query scan would have returned anyway).
+        let mut keyed: Vec<(&String, usize)> = index.iter().map(|(k, &i)| (k, i)).collect();
+        keyed.sort_unstable_by(|a, b| a.1.cmp(&b.1).then_with(|| a.0.cmp(b.0)));
+        let mut seen = HashSet::new();
+        let (search_names, search_indices) = keyed
+            .into_iter()
+            .map(|(k, i)| (k.replace('-', " "), i))
+            .filter(|(k, _)| seen.insert(k.clone()))
+            .unzip();
+
+        StationDb {
+            stations,
+            index,
+            stop_id_to_station,
+            names_lower,
+            route_index,
+            search_names,
+            search_indices,
+        }
     })
 }
 
@@ -71,6 +109,7 @@ fn normalize_station_name(name: &str) -> String {
     static RE_ORDINAL: OnceLock<Regex> = OnceLock::new();
     static RE_DASH_SPACES: OnceLock<Regex> = OnceLock::new();
     static RE_MULTI_SPACE: OnceLock<Regex> = OnceLock::new();
+    static RE_ABBREV: OnceLock<Regex> = OnceLock::new();
 
     let re_ordinal =
         RE_ORDINAL.get_or_init(|| Regex::new(r"(\d+)(st|nd|rd|th)\b").unwrap());
@@ -78,61 +117,58 @@ fn normalize_station_name(name: &str) -> String {
         RE_DASH_SPACES.get_or_init(|| Regex::new(r"\s*-\s*").unwrap());
     let re_multi_space =
         RE_MULTI_SPACE.get_or_init(|| Regex::new(r"\s+").unwrap());
+    let re_abbrev =
+        RE_ABBREV.get_or_init(|| Regex::new(r"street|avenue|square").unwrap());
 
-    let mut s = name.to_lowercase();
+    // Each pass returns a Cow and only allocates when it actually rewrites
+    let s = name.to_lowercase();
     // Remove ordinal suffixes
-    s = re_ordinal.replace_all(&s, "$1").to_string();
+    let s = re_ordinal.replace_all(&s, "$1");
     // Standardize dashes
-    s = re_dash_spaces.replace_all(&s, "-").to_string();
+    let s = re_dash_spaces.replace_all(&s, "-");
     // Collapse whitespace
-    s = re_multi_space.replace_all(&s, " ").to_string();
-    // Common abbreviations
-    s = s.replace("street", "st");
-    s = s.replace("avenue", "av");
-    s = s.replace("square", "sq");
+    let s = re_multi_space.replace_all(&s, " ");
+    // Common abbreviations, all in one scan
+    let s = re_abbrev.replace_all(&s, |caps: &regex::Captures| match &caps[0] {
+        "street" => "st",
+        "avenue" => "av",
+        _ => "sq",
+    });
     s.trim().to_string()
 }
 
-/// Get all stop IDs for a station name with fuzzy matching.
+/// Resolve a station name to its database record with fuzzy matching.
 ///
-/// Tries matching in order: exact → dash-normalized → full-normalized → substring.
-pub fn get_stop_ids_for_station(station_name: &str) -> Vec<String> {
+/// Tries matching in order: exact → normalized → substring. Normalization
+/// standardizes spacing around dashes, so no separate dash-only probe is needed.
+/// Callers that need both stop IDs and routes should resolve once here and
+/// read both from the returned record.
+pub fn find_station(station_name: &str) -> Option<&'static Station> {
     let db = get_db();
     if station_name.is_empty() {
-        return Vec::new();
+        return None;
     }
 
-    let name_lower = station_name.to_lowercase().trim().to_string();
-
     // Exact match
-    if let Some(&idx) = db.index.get(&name_lower) {
-        return db.stations[idx].stop_ids.clone();
-    }
-
-    // Dash normalization
-    let normalized_dash = name_lower.replace(" - ", "-").replace("  ", " ");
-    if let Some(&idx) = db.index.get(&normalized_dash) {
-        return db.stations[idx].stop_ids.clone();
+    let name_lower = station_name.to_lowercase();
+    if let Some(&idx) = db.index.get(name_lower.trim()) {
+        return Some(&db.stations[idx]);
     }
 
     // Full normalization
     let normalized = normalize_station_name(station_name);
     if let Some(&idx) = db.index.get(&normalized) {
-        return db.stations[idx].stop_ids.clone();
+        return Some(&db.stations[idx]);
     }
 
     // Substring match
     let normalized_query = normalized.replace('-', " ");
-    for (indexed_name, &idx) in &db.index {
-        let indexed_normalized = indexed_name.replace('-', " ");
-        if normalized_query.contains(&indexed_normalized)
-            || indexed_normalized.contains(&normalized_query)
-        {
-            return db.stations[idx].stop_ids.clone();
-        }
-    }
-
-    Vec::new()
+    db.search_names
+        .iter()
+        .position(|name| {
+            normalized_query.contains(name.as_str()) || name.contains(&normalized_query)
+        })
+        .map(|pos| &db.stations[db.search_indices[pos]])
 }
 
 /// Get the full station database.
@@ -140,37 +176,82 @@ pub fn get_station_database() -> &'static [Station] {
     &get_db().stations
 }
 
+/// Filter the station database for the web UI's station picker.
+///
+/// `search` is a case-insensitive name substring and `route` an exact route
+/// ID; empty values don't filter. Uses the precomputed lowercase names and
+/// route index, so a query does no per-station lowercasing and a route
+/// filter only visits that route's stations. Results are in database order.
+pub fn search_stations(
+    search: &str,
+    route: &str,
+    multi_platform_only: bool,
+) -> Vec<&'static Station> {
+    let db = get_db();
+    let search = search.to_lowercase();
+    let keep = |&i: &usize| {
+        (search.is_empty() || db.names_lower[i].contains(&search))
+            && (!multi_platform_only || db.stations[i].platform_count > 1)
+    };
+
+    if route.is_empty() {
+        (0..db.stations.len())
+            .filter(keep)
+            .map(|i| &db.stations[i])
+            .collect()
+    } else {
+        db.route_index
+            .get(route)
+            .map(|indices| {
+                indices
+                    .iter()
+                    .copied()
+                    .filter(keep)
+                    .map(|i| &db.stations[i])
+                    .collect()
+            })
+            .unwrap_or_default()
+    }
+}
+
 /// Look up station name from a stop ID (e.g., "635N" → "Times Sq-42 St").
 ///
 /// Strips the N/S direction suffix before matching.
 pub fn station_name_for_stop_id(stop_id: &str) -> Option<&'static str> {
     let db = get_db();
     let base = stop_id.trim_end_matches(['N', 'S']);
-    db.stop_id_to_name.get(base).map(|s| s.as_str())
-}
-
-/// Look up routes served at a station by name.
-pub fn get_routes_for_station(station_name: &str) -> Vec<String> {
-    let db = get_db();
-    let name_lower = station_name.to_lowercase();
-    for station in &db.stations {
-        if station.name.to_lowercase() == name_lower {
-            return station.routes.clone();
-        }
-    }
-    Vec::new()
+    db.stop_id_to_station
+        .get(base)
+        .map(|&idx| db.stations[idx].name.as_str())
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    fn stop_ids_for(station_name: &str) -> Vec<String> {
+        find_station(station_name)
+            .map(|s| s.stop_ids.clone())
+            .unwrap_or_default()
+    }
+
+    fn routes_for(station_name: &str) -> Vec<String> {
+        find_station(station_name)
+            .map(|s| s.routes.clone())
+            .unwrap_or_default()
+    }
+
     #[test]
     fn test_normalize_station_name() {
         assert_eq!(normalize_station_name("42nd Street"), "42 st");
         assert_eq!(normalize_station_name("Times Sq - 42 St"), "times sq-42 st");
         assert_eq!(normalize_station_name("1st Avenue"), "1 av");
         assert_eq!(normalize_station_name("  103 St  "), "103 st");
+        assert_eq!(
+            normalize_station_name("Washington Square - 5th Avenue Street"),
+            "washington sq-5 av st"
+        );
+        assert_eq!(normalize_station_name("Bedford Av"), "bedford av");
     }
 
     #[test]
@@ -184,31 +265,101 @@ mod tests {
 
     #[test]
     fn test_exact_lookup() {
-        let ids = get_stop_ids_for_station("Times Sq-42 St");
+        let ids = stop_ids_for("Times Sq-42 St");
         assert!(!ids.is_empty(), "Times Sq-42 St should have stop IDs");
     }
 
     #[test]
     fn test_fuzzy_lookup() {
         // "times square 42 street" should match via normalization
-        let ids = get_stop_ids_for_station("times square 42 street");
+        let ids = stop_ids_for("times square 42 street");
         assert!(!ids.is_empty(), "fuzzy match should find Times Sq-42 St");
     }
 
+    #[test]
+    fn test_substring_lookup_matches_exact() {
+        // Substring fallback scans in station order, so the result is stable
+        assert_eq!(
+            stop_ids_for("times square 42 street"),
+            stop_ids_for("Times Sq-42 St")
+        );
+    }
+
+    #[test]
+    fn test_search_names_unique() {
+        let db = get_db();
+        let unique: HashSet<&String> = db.search_names.iter().collect();
+        assert_eq!(unique.len(), db.search_names.len());
+        assert_eq!(db.search_names.len(), db.search_indices.len());
+    }
+
+    #[test]
+    fn test_station_name_for_stop_id() {
+        let ids = stop_ids_for("Times Sq-42 St");
+        let name = station_name_for_stop_id(&ids[0]).expect("stop ID should resolve");
+        assert!(stop_ids_for(name).contains(&ids[0]));
+        let base = ids[0].trim_end_matches(['N', 'S']);
+        assert_eq!(station_name_for_stop_id(&format!("{base}S")), Some(name));
+        assert_eq!(station_name_for_stop_id("XYZ999N"), None);
+    }
+
+    #[test]
+    fn test_search_stations_matches_scan() {
+        let all = get_station_database();
+        for (search, route, multi) in [
+            ("", "", false),
+            ("St", "", false),
+            ("sq", "1", false),
+            ("", "A", true),
+            ("AV", "L", false),
+            ("", "NOPE", false),
+        ] {
+            let expected: Vec<&str> = all
+                .iter()
+                .filter(|s| {
+                    s.name.to_lowercase().contains(&search.to_lowercase())
+                        && (route.is_empty() || s.routes.iter().any(|r| r == route))
+                        && (!multi || s.platform_count > 1)
+                })
+                .map(|s| s.name.as_str())
+                .collect();
+            let got: Vec<&str> = search_stations(search, route, multi)
+                .iter()
+                .map(|s| s.name.as_str())
+                .collect();
+            assert_eq!(got, expected, "search={search:?} route={route:?} multi={multi}");
+        }
+    }
+
     #[test]
     fn test_unknown_station() {
-        let ids = get_stop_ids_for_station("Nonexistent Station XYZ");
+        let ids = stop_ids_for("Nonexistent Station XYZ");
         assert!(ids.is_empty());
     }
 
     #[test]
-    fn test_get_routes_for_station() {
-        let routes = get_routes_for_station("Times Sq-42 St");
+    fn test_routes() {
+        let routes = routes_for("Times Sq-42 St");
         assert!(!routes.is_empty(), "Times Sq should have routes");
     }
 
+    #[test]
+    fn test_get_routes_case_insensitive() {
+        assert_eq!(
+            routes_for("times sq-42 st"),
+            routes_for("Times Sq-42 St")
+        );
+        assert!(routes_for("Nonexistent Station XYZ").is_empty());
+    }
+
+    #[test]
+    fn test_get_routes_fuzzy_matches_stop_ids() {
+        let routes = routes_for("times square 42 street");
+        assert_eq!(routes, routes_for("Times Sq-42 St"));
+    }
+
     #[test]
     fn test_empty_query() {
-        assert!(get_stop_ids_for_station("").is_empty());
+        assert!(stop_ids_for("").is_empty());
     }
 }
@@ -1,11 +1,13 @@
 use std::sync::atomic::Ordering;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
+use axum::body::Bytes;
+use axum::extract::rejection::JsonRejection;
 use axum::extract::{Path, Query, State};
-use axum::http::StatusCode;
+use axum::http::{header, StatusCode};
 use axum::response::IntoResponse;
 use axum::Json;
-use serde::Deserialize;
+use serde::{Deserialize, Serialize};
 use serde_json::json;
 use tracing::{info, warn};
 
@@ -22,6 +24,29 @@ pub struct StationSearchParams {
     multi_platform_only: Option<String>,
 }
 
+/// One station in the /api/stations/complete response, borrowed from the database.
+#[derive(Serialize)]
+struct StationEntry<'a> {
+    name: &'a str,
+    routes: &'a [String],
+    stop_ids: &'a [String],
+    platform_count: u32,
+    borough: &'a str,
+}
+
+/// Body of the /api/stations/complete response.
+#[derive(Serialize)]
+struct CompleteStationsResponse<'a> {
+    success: bool,
+    stations: Vec<StationEntry<'a>>,
+    total: usize,
+    database_total: usize,
+}
+
+/// Serialized unfiltered /api/stations/complete body. The station database
+/// is immutable, so it is built once on first request.
+static ALL_STATIONS_BODY: OnceLock<Bytes> = OnceLock::new();
+
 /// GET /api/config — return current config as JSON.
 pub async fn get_config(State(state): State<Arc<AppState>>) -> impl IntoResponse {
     let config = state.config.load();
@@ -36,13 +61,29 @@ pub async fn get_config(State(state): State<Arc<AppState>>) -> impl IntoResponse
 }
 
 /// POST /api/config — validate and save new config.
+///
+/// A rejected body (malformed JSON, wrong content type, too large) keeps
+/// axum's status code but gets the usual `{success, message}` JSON body
+/// instead of axum's plain-text rejection.
 pub async fn update_config(
     State(state): State<Arc<AppState>>,
-    Json(body): Json<serde_json::Value>,
+    body: Result<Json<serde_json::Value>, JsonRejection>,
 ) -> impl IntoResponse {
-    let validated_json = serde_json::to_string_pretty(&body).unwrap_or_default();
+    let body = match body {
+        Ok(Json(body)) => body,
+        Err(rejection) => {
+            return (
+                rejection.status(),
+                Json(json!({
+                    "success": false,
+                    "message": format!("Invalid JSON: {}", rejection.body_text())
+                })),
+            );
+        }
+    };
 
-    let new_config = match Config::from_json(&validated_json) {
+    // Validate the parsed body directly; it is only serialized for the write
+    let new_config = match Config::from_value(&body) {
         Ok(cfg) => cfg,
         Err(e) => {
             return (
@@ -51,6 +92,7 @@ pub async fn update_config(
             );
         }
     };
+    let validated_json = serde_json::to_string_pretty(&body).unwrap_or_default();
 
     // Atomic write via spawn_blocking (sync fs ops: rename, sync_all)
     let write_result = tokio::task::spawn_blocking({
@@ -60,8 +102,9 @@ pub async fn update_config(
     .await;
 
     match write_result {
-        Ok(Ok(_)) => {
+        Ok(Ok(mtime)) => {
             info!("[WEB] Config saved (atomic)");
+            state.set_config_mtime(mtime);
             state.config.store(Arc::new(new_config));
             state.config_changed.notify_one();
             (
@@ -149,54 +192,33 @@ pub async fn get_debug_snapshot(State(state): State<Arc<AppState>>) -> impl Into
 }
 
 /// GET /api/stations/complete — search/filter complete station database.
-pub async fn get_complete_stations(
-    Query(params): Query<StationSearchParams>,
-) -> impl IntoResponse {
-    let all_stations = stations::get_station_database();
-
-    let search = params.search.unwrap_or_default().to_lowercase();
+///
+/// The station picker loads the full list repeatedly, so that body is
+/// serialized once and reused. Filtered queries are cheap over the indexed
+/// database and are built per request.
+pub async fn get_complete_stations(Query(params): Query<StationSearchParams>) -> impl IntoResponse {
+    let search = params.search.unwrap_or_default();
     let route_filter = params.route.unwrap_or_default();
     let multi_only = params
         .multi_platform_only
         .unwrap_or_default()
-        .to_lowercase()
-        == "true";
-
-    let database_total = all_stations.len();
-
-    let filtered: Vec<serde_json::Value> = all_stations
-        .iter()
-        .filter(|s| {
-            (search.is_empty() || s.name.to_lowercase().contains(&search))
-                && (route_filter.is_empty() || s.routes.contains(&route_filter))
-                && (!multi_only || s.platform_count > 1)
-        })
-        .map(|s| {
-            json!({
-                "name": s.name,
-                "routes": s.routes,
-                "stop_ids": s.stop_ids,
-                "platform_count": s.platform_count,
-                "borough": s.borough,
-            })
-        })
-        .collect();
+        .eq_ignore_ascii_case("true");
 
-    let total = filtered.len();
+    let body = if search.is_empty() && route_filter.is_empty() && !multi_only {
+        ALL_STATIONS_BODY
+            .get_or_init(|| build_complete_stations_body("", "", false))
+            .clone()
+    } else {
+        build_complete_stations_body(&search, &route_filter, multi_only)
+    };
 
-    Json(json!({
-        "success": true,
-        "stations": filtered,
-        "total": total,
-        "database_total": database_total,
-    }))
+    ([(header::CONTENT_TYPE, "application/json")], body)
 }
 
 /// GET /api/stations/lookup/:station_name — look up stop IDs for a station.
 pub async fn lookup_station(Path(station_name): Path<String>) -> impl IntoResponse {
-    let stop_ids = stations::get_stop_ids_for_station(&station_name);
-
-    if stop_ids.is_empty() {
+    let Some(station) = stations::find_station(&station_name).filter(|s| !s.stop_ids.is_empty())
+    else {
         return (
             StatusCode::NOT_FOUND,
             Json(json!({
@@ -205,19 +227,18 @@ pub async fn lookup_station(Path(station_name): Path<String>) -> impl IntoRespon
                 "suggestion": "Try searching with /api/stations/complete?search=<partial_name>"
             })),
         );
-    }
+    };
 
-    let routes = stations::get_routes_for_station(&station_name);
-    let platform_count = stop_ids.len() / 2;
+    let platform_count = station.stop_ids.len() / 2;
 
     (
         StatusCode::OK,
         Json(json!({
             "success": true,
             "station_name": station_name,
-            "stop_ids": stop_ids,
+            "stop_ids": station.stop_ids,
             "platform_count": platform_count,
-            "routes": routes,
+            "routes": station.routes,
         })),
     )
 }
@@ -226,8 +247,22 @@ pub async fn lookup_station(Path(station_name): Path<String>) -> impl IntoRespon
 pub async fn restart(State(state): State<Arc<AppState>>) -> impl IntoResponse {
     info!("[WEB] Restart requested — reloading config");
 
-    match Config::load(&state.config_path) {
-        Ok(new_config) => {
+    // Config::load does sync file I/O (and may restore the backup), so keep
+    // it off the runtime threads that serve the status polls. The mtime is
+    // read before loading: an edit made during the load then still looks new
+    // to the watcher (an extra reload is harmless, a missed one is not).
+    let load_result = tokio::task::spawn_blocking({
+        let path = state.config_path.clone();
+        move || {
+            let mtime = crate::config::config_mtime(&path);
+            (Config::load(&path), mtime)
+        }
+    })
+    .await;
+
+    match load_result {
+        Ok((Ok(new_config), mtime)) => {
+            state.set_config_mtime(mtime);
             state.config.store(Arc::new(new_config));
             state.config_changed.notify_one();
             Json(json!({
@@ -235,10 +270,17 @@ pub async fn restart(State(state): State<Arc<AppState>>) -> impl IntoResponse {
                 "message": "Configuration reloaded successfully"
             }))
         }
-        Err(e) => Json(json!({
+        Ok((Err(e), _)) => Json(json!({
             "success": false,
             "message": format!("Reload failed: {}", e)
         })),
+        Err(e) => {
+            warn!("[WEB] Config reload task failed: {}", e);
+            Json(json!({
+                "success": false,
+                "message": format!("Reload failed: {}", e)
+            }))
+        }
     }
 }
 
@@ -272,15 +314,37 @@ pub async fn healthz(State(state): State<Arc<AppState>>) -> impl IntoResponse {
 
 // -- Helper functions --
 
-/// Get config file mtime as RFC 3339 string (for last_modified / last_update).
+/// Config file mtime as RFC 3339 string (for last_modified / last_update).
+///
+/// Served from the string cached in `AppState`, which the config watcher and
+/// `update_config` refresh, so polling endpoints never stat the file.
 fn config_file_mtime(state: &AppState) -> Option<String> {
-    std::fs::metadata(&state.config_path)
-        .and_then(|m| m.modified())
-        .ok()
-        .map(|t| {
-            let datetime: chrono::DateTime<chrono::Local> = t.into();
-            datetime.to_rfc3339()
+    state.config_mtime.load().rfc3339.clone()
+}
+
+/// Filter the station database and serialize the /api/stations/complete body.
+///
+/// Entries borrow from the static database and are written straight to
+/// bytes, without building an intermediate `serde_json::Value` tree.
+fn build_complete_stations_body(search: &str, route_filter: &str, multi_only: bool) -> Bytes {
+    let entries: Vec<StationEntry> = stations::search_stations(search, route_filter, multi_only)
+        .into_iter()
+        .map(|s| StationEntry {
+            name: &s.name,
+            routes: &s.routes,
+            stop_ids: &s.stop_ids,
+            platform_count: s.platform_count,
+            borough: &s.borough,
         })
+        .collect();
+
+    let body = CompleteStationsResponse {
+        success: true,
+        total: entries.len(),
+        stations: entries,
+        database_total: stations::get_station_database().len(),
+    };
+    Bytes::from(serde_json::to_vec(&body).unwrap_or_default())
 }
 
 fn config_to_json(config: &Config) -> serde_json::Value {
@@ -320,17 +384,8 @@ fn determine_station_name(config: &Config) -> String {
     config
         .station_stops
         .first()
-        .and_then(|(up, _)| {
-            let base_id = up.trim_end_matches(['N', 'S']);
-            stations::get_station_database()
-                .iter()
-                .find(|s| {
-                    s.stop_ids
-                        .iter()
-                        .any(|sid| sid.trim_end_matches(['N', 'S']) == base_id)
-                })
-                .map(|s| s.name.clone())
-        })
+        .and_then(|(up, _)| stations::station_name_for_stop_id(up))
+        .map(str::to_string)
         .unwrap_or_else(|| {
             if config.station_stops.is_empty() {
                 "Not configured".into()
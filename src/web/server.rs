@@ -1,11 +1,13 @@
+use std::fmt::Write;
 use std::sync::Arc;
 
 use axum::extract::DefaultBodyLimit;
-use axum::http::{header, StatusCode};
+use axum::http::{header, HeaderMap, StatusCode};
 use axum::response::{IntoResponse, Response};
 use axum::routing::{get, post};
 use axum::Router;
 use rust_embed::Embed;
+use tower_http::compression::{CompressionLayer, CompressionLevel};
 use tracing::info;
 
 use crate::AppState;
@@ -34,6 +36,9 @@ pub async fn run(state: Arc<AppState>) {
         .fallback(get(serve_static))
         // Middleware
         .layer(DefaultBodyLimit::max(65536)) // 64KB max request body
+        // Gzip JSON and text assets (the station list is large and repetitive);
+        // a mid-range level keeps CPU cost low on the Pi
+        .layer(CompressionLayer::new().quality(CompressionLevel::Precise(4)))
         // Shared state
         .with_state(state.clone());
 
@@ -58,29 +63,75 @@ pub async fn run(state: Arc<AppState>) {
 }
 
 /// Serve the main index.html page.
-async fn serve_index() -> Response {
-    serve_embedded_file("templates/index.html").await
+async fn serve_index(headers: HeaderMap) -> Response {
+    serve_embedded_file("templates/index.html", &headers)
 }
 
 /// Serve static files from embedded assets.
-async fn serve_static(uri: axum::http::Uri) -> Response {
+async fn serve_static(uri: axum::http::Uri, headers: HeaderMap) -> Response {
     let path = uri.path().trim_start_matches('/');
-    serve_embedded_file(path).await
+    serve_embedded_file(path, &headers)
 }
 
 /// Look up and serve an embedded file with appropriate content type.
-async fn serve_embedded_file(path: &str) -> Response {
-    match WebAssets::get(path) {
-        Some(file) => {
-            let mime = mime_for_path(path);
-            (
-                StatusCode::OK,
-                [(header::CONTENT_TYPE, mime)],
-                file.data.to_vec(),
-            )
-                .into_response()
-        }
-        None => StatusCode::NOT_FOUND.into_response(),
+///
+/// Responses carry an ETag derived from the embedded content hash, so a
+/// browser revalidating an unchanged asset gets an empty 304. The tag is
+/// weak because the compression layer may re-encode the body. The body is
+/// handed to axum as the embedded slice rather than copied per request.
+fn serve_embedded_file(path: &str, headers: &HeaderMap) -> Response {
+    let Some(file) = WebAssets::get(path) else {
+        return StatusCode::NOT_FOUND.into_response();
+    };
+
+    let mut etag = String::with_capacity(34);
+    etag.push('"');
+    for b in &file.metadata.sha256_hash()[..16] {
+        let _ = write!(etag, "{:02x}", b);
+    }
+    etag.push('"');
+    let weak_etag = format!("W/{}", etag);
+    let cache_control = cache_control_for_path(path);
+
+    let not_modified = headers
+        .get(header::IF_NONE_MATCH)
+        .and_then(|v| v.to_str().ok())
+        .is_some_and(|v| {
+            v.split(',')
+                .any(|tag| tag.trim().trim_start_matches("W/") == etag || tag.trim() == "*")
+        });
+    if not_modified {
+        return (
+            StatusCode::NOT_MODIFIED,
+            [
+                (header::ETAG, weak_etag.as_str()),
+                (header::CACHE_CONTROL, cache_control),
+            ],
+        )
+            .into_response();
+    }
+
+    (
+        StatusCode::OK,
+        [
+            (header::CONTENT_TYPE, mime_for_path(path)),
+            (header::ETAG, weak_etag.as_str()),
+            (header::CACHE_CONTROL, cache_control),
+        ],
+        file.data,
+    )
+        .into_response()
+}
+
+/// Caching policy by file type.
+///
+/// Icons rarely change and can be reused for a day. Everything else (HTML,
+/// CSS, JS, manifest, service worker) keeps its unhashed name across
+/// upgrades, so browsers revalidate it via the ETag on each load.
+fn cache_control_for_path(path: &str) -> &'static str {
+    match path.rsplit('.').next() {
+        Some("png") | Some("ico") | Some("svg") => "public, max-age=86400",
+        _ => "no-cache",
     }
 }
 
@@ -98,3 +149,79 @@ fn mime_for_path(path: &str) -> &'static str {
         _ => "application/octet-stream",
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use axum::http::HeaderValue;
+
+    const INDEX: &str = "templates/index.html";
+
+    fn request_with(if_none_match: &str) -> HeaderMap {
+        let mut headers = HeaderMap::new();
+        headers.insert(
+            header::IF_NONE_MATCH,
+            HeaderValue::from_str(if_none_match).unwrap(),
+        );
+        headers
+    }
+
+    fn index_etag() -> String {
+        let resp = serve_embedded_file(INDEX, &HeaderMap::new());
+        resp.headers()[header::ETAG].to_str().unwrap().to_string()
+    }
+
+    #[test]
+    fn test_serves_with_weak_etag() {
+        let resp = serve_embedded_file(INDEX, &HeaderMap::new());
+        assert_eq!(resp.status(), StatusCode::OK);
+        let etag = resp.headers()[header::ETAG].to_str().unwrap();
+        // W/ + quoted 16-byte hex digest
+        assert!(etag.starts_with("W/\"") && etag.ends_with('"'), "{etag}");
+        assert_eq!(etag.len(), 2 + 2 + 32);
+        assert_eq!(resp.headers()[header::CACHE_CONTROL], "no-cache");
+    }
+
+    #[test]
+    fn test_matching_etag_returns_304() {
+        let etag = index_etag();
+        let resp = serve_embedded_file(INDEX, &request_with(&etag));
+        assert_eq!(resp.status(), StatusCode::NOT_MODIFIED);
+        assert_eq!(resp.headers()[header::ETAG], etag.as_str());
+
+        // Strong form of the same tag, and inside a comma-separated list
+        let strong = etag.trim_start_matches("W/");
+        let resp = serve_embedded_file(INDEX, &request_with(strong));
+        assert_eq!(resp.status(), StatusCode::NOT_MODIFIED);
+        let list = format!("\"other\", {etag}");
+        let resp = serve_embedded_file(INDEX, &request_with(&list));
+        assert_eq!(resp.status(), StatusCode::NOT_MODIFIED);
+    }
+
+    #[test]
+    fn test_wildcard_returns_304() {
+        let resp = serve_embedded_file(INDEX, &request_with("*"));
+        assert_eq!(resp.status(), StatusCode::NOT_MODIFIED);
+    }
+
+    #[test]
+    fn test_non_matching_etag_returns_200() {
+        let resp = serve_embedded_file(INDEX, &request_with("W/\"deadbeef\", \"other\""));
+        assert_eq!(resp.status(), StatusCode::OK);
+    }
+
+    #[test]
+    fn test_missing_file_is_404() {
+        let resp = serve_embedded_file("static/nope.css", &HeaderMap::new());
+        assert_eq!(resp.status(), StatusCode::NOT_FOUND);
+    }
+
+    #[test]
+    fn test_cache_control_for_path() {
+        let day = "public, max-age=86400";
+        assert_eq!(cache_control_for_path("static/icon-192.png"), day);
+        assert_eq!(cache_control_for_path("static/icon.svg"), day);
+        assert_eq!(cache_control_for_path("templates/index.html"), "no-cache");
+        assert_eq!(cache_control_for_path("static/style.css"), "no-cache");
+    }
+}